@@ -1,47 +1,117 @@
 from collections import deque
+from Algoritmos.motor_fifo import MotorFIFO, MotorFIFODenso
+from Algoritmos.motor_lru import MotorLRU, MotorLRUDenso
+from Algoritmos.motor_optimo import MotorOptimo, MotorOptimoDenso, siguiente_uso
+from Algoritmos.motor_segunda_oportunidad import MotorSegundaOportunidad
+from Algoritmos.resultado import ResultadoEventos
+from Algoritmos.traza import Traza, en_bloques
+
+# Cada cuántas referencias se llama al callback de progreso
+PASO_PROGRESO = 4096
+
+
+def _paginas_y_valores(referencia):
+    """
+    Si la referencia es una Traza retorna (ids densos, valores) para usar los
+    motores con arreglos planos; si no, (referencia, None). Ambos quedan como
+    arreglos de NumPy: los motores los recorren con en_bloques y 'valores'
+    solo se consulta al registrar un evento.
+    """
+    if isinstance(referencia, Traza):
+        return referencia.ids, referencia.valores
+    return referencia, None
+
+
+def _recorrer(paginas, valores):
+    # Páginas para el motor: ints de Python, por bloques si son ids densos
+    return paginas if valores is None else en_bloques(paginas)
+
+
+def _resultado_eventos(accesos, paginas, marcos, valores=None, progreso=None):
+    """
+    Arma el ResultadoEventos de un motor sin bits (FIFO, LRU, Óptimo) a partir
+    de sus resultados (fallo, marco, victima): solo los fallos cambian un marco.
+    Con ids densos, 'valores' traduce cada id a su página original para mostrarla.
+    """
+    resultado = ResultadoEventos(marcos, len(paginas))
+    for t, (fallo, marco, victima) in enumerate(accesos):
+        if progreso is not None and t % PASO_PROGRESO == 0:
+            progreso(t, resultado.total_fallos)
+        if fallo:
+            resultado.marcar_fallo(t)
+            if valores is None:
+                resultado.registrar(t, marco, paginas[t], victima)
+            else:
+                resultado.registrar(t, marco, int(valores[paginas[t]]),
+                                    -1 if victima == -1 else int(valores[victima]))
+    if progreso is not None:
+        progreso(len(paginas), resultado.total_fallos)
+    return resultado
+
+
+def _salida(resultado, eventos):
+    # Con eventos=True se devuelve el resultado compacto; si no, la matriz densa
+    if eventos:
+        return resultado
+    return resultado.matriz(), resultado.fallos_col(), resultado.total_fallos
+
+
+def _estadisticas(accesos):
+    """
+    Cuenta aciertos, fallos y reemplazos a partir de los resultados
+    (fallo, marco, victima) de un motor, sin guardar ningún estado por columna.
+    """
+    aciertos = fallos = reemplazos = 0
+    for fallo, _, victima in accesos:
+        if fallo:
+            fallos += 1
+            if victima != -1:
+                reemplazos += 1
+        else:
+            aciertos += 1
+    return aciertos, fallos, reemplazos
+
+
 class Algoritmos:
 
-    def fifo(self, referencia, marcos):
+    def fifo(self, referencia, marcos, solo_estadisticas=False, eventos=False,
+             progreso=None):
         """
         referencia: lista con las páginas solicitadas (ej: [1,2,3,4,1,...])
         marcos: número de marcos disponibles
-        """
-        # Inicializamos la estructura de marcos (cada fila es un marco fijo)
-        frames = [-1] * marcos  # -1 indica marco vacío
 
-        # Matriz: 'marcos' filas, len(referencia) columnas
-        # Cada columna representará el estado de frames luego de cada referencia
-        matriz = [[None] * len(referencia) for _ in range(marcos)]
+        Con solo_estadisticas=True no se construyen matriz ni fallos_col
+        (memoria O(marcos)) y se retorna (aciertos, total_fallos, reemplazos).
 
-        # Para registrar los fallos de página ('*' o '')
-        fallos_col = [''] * len(referencia)  
-        contador_fallos = 0
+        Con eventos=True se retorna un ResultadoEventos (solo los cambios de
+        cada marco, tamaño O(fallos)) en lugar de la matriz densa.
 
-        # 'pointer' para saber qué marco reemplazar (ciclo FIFO)
-        pointer = 0  
+        referencia también puede ser una Traza (ids densos, ver traza.py): en
+        ese caso el motor usa arreglos planos y la matriz muestra las páginas
+        originales.
 
-        for i, pagina in enumerate(referencia):
-            # Si la página ya está en frames, no hay fallo
-            if pagina in frames:
-                # No aumenta contador de fallos
-                fallos_col[i] = ''
-            else:
-                # Fallo de página
-                contador_fallos += 1
-                fallos_col[i] = '*'
-                # Reemplazamos la página que entró primero (FIFO)
-                frames[pointer] = pagina  
-                # Avanzamos el pointer de forma circular
-                pointer = (pointer + 1) % marcos
-
-            # Guardamos el estado actual de los marcos en la columna i
-            for fila in range(marcos):
-                matriz[fila][i] = frames[fila] if frames[fila] != -1 else ''
-
-        return matriz, fallos_col, contador_fallos
+        progreso(referencias_procesadas, fallos) se llama cada PASO_PROGRESO
+        referencias y al terminar; si lanza una excepción, la simulación se
+        interrumpe (así se cancela desde la GUI).
+        """
+        paginas, valores = _paginas_y_valores(referencia)
+        # El motor lleva la residencia (página -> marco) y el pointer circular
+        if valores is None:
+            motor = MotorFIFO(marcos)
+        else:
+            motor = MotorFIFODenso(marcos, len(valores))
+        accesos = map(motor.acceder, _recorrer(paginas, valores))
+        if solo_estadisticas:
+            return _estadisticas(accesos)
+
+        # Solo se registra el marco que cambió en cada fallo; la matriz
+        # ('marcos' filas x len(referencia) columnas) se arma al final
+        resultado = _resultado_eventos(accesos, paginas, marcos, valores, progreso)
+        return _salida(resultado, eventos)
     
 
-    def lru(self, referencia, marcos):
+    def lru(self, referencia, marcos, solo_estadisticas=False, eventos=False,
+            progreso=None):
         """
         referencia: lista con las páginas solicitadas, ej: [1,2,3,4,1,2,5...]
         marcos: número de marcos disponibles
@@ -50,51 +120,26 @@ class Algoritmos:
           - matriz: estado de cada marco luego de cada referencia
           - fallos_col: lista con '' o '*' según ocurra o no un fallo
           - total_fallos: número total de fallos de página
-        """
-
-        # frames[i] = página cargada en el marco i (inicialmente -1 o vacía)
-        frames = [-1] * marcos
-        
-        # Para registrar el uso reciente: usage[i] = índice de la última referencia
-        usage = [-1] * marcos
 
-        # Matriz con marcos filas x len(referencia) columnas
-        matriz = [[None]*len(referencia) for _ in range(marcos)]
-        fallos_col = [''] * len(referencia)  # '*' si hay fallo, '' si no
-        total_fallos = 0
-
-        for t, pagina in enumerate(referencia):
-            if pagina in frames:
-                # No hay fallo de página
-                fallos_col[t] = ''
-                # Actualizamos la última referencia de la página
-                idx = frames.index(pagina)
-                usage[idx] = t
-            else:
-                # Hay fallo de página
-                total_fallos += 1
-                fallos_col[t] = '*'
+        solo_estadisticas, eventos, progreso y referencia como Traza: igual
+        que en fifo.
+        """
 
-                if -1 in frames:
-                    # Aún hay marcos libres
-                    free_index = frames.index(-1)
-                    frames[free_index] = pagina
-                    usage[free_index] = t
-                else:
-                    # Reemplazamos la página menos recientemente usada
-                    # => la que tenga la última referencia más pequeña
-                    lru_index = usage.index(min(usage))
-                    frames[lru_index] = pagina
-                    usage[lru_index] = t
-
-            # Actualizar la matriz para esta columna
-            for fila in range(marcos):
-                # Si el marco está vacío (=-1), ponemos ''
-                matriz[fila][t] = '' if frames[fila] == -1 else frames[fila]
-
-        return matriz, fallos_col, total_fallos
+        paginas, valores = _paginas_y_valores(referencia)
+        # El motor lleva el estado de los marcos y la recencia en O(1) por referencia
+        if valores is None:
+            motor = MotorLRU(marcos)
+        else:
+            motor = MotorLRUDenso(marcos, len(valores))
+        accesos = map(motor.acceder, _recorrer(paginas, valores))
+        if solo_estadisticas:
+            return _estadisticas(accesos)
+
+        resultado = _resultado_eventos(accesos, paginas, marcos, valores, progreso)
+        return _salida(resultado, eventos)
     
-    def optimo(self, referencia, marcos):
+    def optimo(self, referencia, marcos, solo_estadisticas=False, eventos=False,
+               progreso=None):
         """
         referencia: lista con las páginas solicitadas (ej: [6,1,7,1,2,5,...])
         marcos: número de marcos disponibles
@@ -103,89 +148,29 @@ class Algoritmos:
          - matriz: estado de los marcos luego de cada referencia (marcos filas x len(referencia) columnas)
          - fallos_col: lista con '*' o '' si hay fallo o no
          - total_fallos: número total de fallos de página
-        """
-
-        # frames[f] = página en el marco f (inicialmente -1 o vacío)
-        frames = [-1] * marcos
-
-        # Para llevar control de cuándo se insertó cada página en cada marco (por FIFO en caso de que varias no aparezcan).
-        insertion_time = [-1] * marcos
 
-        # Matriz (marcos filas x len(referencia) columnas)
-        matriz = [[None]*len(referencia) for _ in range(marcos)]
-        fallos_col = [''] * len(referencia)
-        total_fallos = 0
-
-        def next_occurrence(page, start_index):
-            """
-            Retorna el índice de la próxima vez que 'page' aparece en 'referencia'
-            a partir de 'start_index'. Si no aparece más, retorna None.
-            """
-            for idx in range(start_index, len(referencia)):
-                if referencia[idx] == page:
-                    return idx
-            return None  # No aparece de nuevo
-
-        for i, pagina in enumerate(referencia):
-            if pagina in frames:
-                # No hay fallo de página
-                fallos_col[i] = ''
-            else:
-                # Ocurre fallo
-                total_fallos += 1
-                fallos_col[i] = '*'
+        solo_estadisticas, eventos, progreso y referencia como Traza: igual
+        que en fifo (con solo_estadisticas se guarda igual el próximo uso de
+        cada referencia, que el algoritmo necesita de todas formas).
+        """
 
-                # Ver si hay espacio libre
-                if -1 in frames:
-                    # Asignar a primer marco libre
-                    free_index = frames.index(-1)
-                    frames[free_index] = pagina
-                    insertion_time[free_index] = i  # Registramos que se insertó en el tiempo i
-                else:
-                    # Reemplazo Óptimo:
-                    # 1. Verificar si hay páginas que no aparezcan de nuevo
-                    # 2. Si varias no aparecen, reemplazar la que se insertó primero (FIFO).
-                    # 3. Si todas aparecen, reemplazar la más lejana.
-                    max_distance = -1
-                    replace_index = None
-
-                    # Guardamos temporalmente las que no aparecen más adelante
-                    pages_not_used = []
-
-                    for f in range(marcos):
-                        dist = next_occurrence(frames[f], i+1)
-                        if dist is None:
-                            # No se usará más adelante
-                            pages_not_used.append(f)
-                        else:
-                            # Se usará en el futuro
-                            if dist > max_distance:
-                                max_distance = dist
-                                replace_index = f
-
-                    if pages_not_used:
-                        # Si hay varias páginas no usadas, usamos la que entró primero
-                        if len(pages_not_used) == 1:
-                            # Solo una no aparece más
-                            replace_index = pages_not_used[0]
-                        else:
-                            # Múltiples no aparecerán => FIFO entre ellas
-                            # Escogemos la de insertion_time más antiguo
-                            oldest_time = float('inf')
-                            for f in pages_not_used:
-                                if insertion_time[f] < oldest_time:
-                                    oldest_time = insertion_time[f]
-                                    replace_index = f
-
-                    # Reemplazamos en frames[replace_index]
-                    frames[replace_index] = pagina
-                    insertion_time[replace_index] = i  # Actualizamos inserción
-
-            # Actualizar la matriz para esta columna
-            for fila in range(marcos):
-                matriz[fila][i] = '' if frames[fila] == -1 else frames[fila]
-
-        return matriz, fallos_col, total_fallos
+        paginas, valores = _paginas_y_valores(referencia)
+        # Próximo uso de cada referencia, calculado una sola vez
+        # El motor elige la víctima con un heap por próximo uso
+        # (empate entre páginas que no aparecen más => FIFO por insertion_time)
+        if valores is None:
+            siguiente = siguiente_uso(paginas)
+            motor = MotorOptimo(marcos)
+        else:
+            # Índice compartido de la traza (se calcula una sola vez con NumPy)
+            siguiente = en_bloques(referencia.indice.next_use)
+            motor = MotorOptimoDenso(marcos, len(valores))
+        accesos = map(motor.acceder, _recorrer(paginas, valores), siguiente)
+        if solo_estadisticas:
+            return _estadisticas(accesos)
+
+        resultado = _resultado_eventos(accesos, paginas, marcos, valores, progreso)
+        return _salida(resultado, eventos)
     
     """
     def fifo_mejorado(self, referencia, num_marcos):
@@ -263,7 +248,8 @@ class Algoritmos:
         return matrix, fallos_col, total_fallos
     """
 
-    def fifo_mejorado(self, referencia, num_marcos):
+    def fifo_mejorado(self, referencia, num_marcos, solo_estadisticas=False, eventos=False,
+                      progreso=None):
         """
         FIFO + segunda oportunidad (segunda vida):
         - Cada vez que un page hit, se limpia todo bit y se marca ese marco con bit=True.
@@ -274,69 +260,60 @@ class Algoritmos:
         - matriz: num_marcos filas x len(referencia) columnas
         - fallos_col: lista de '*' o '' de longitud len(referencia)
         - total_fallos: entero
-        """
-        n = len(referencia)
-        # Cada marco lleva: página, bit (segunda vida) y tiempo de inserción
-        frames = [
-            {'page': None, 'bit': False, 'insertion_time': float('inf')}
-            for _ in range(num_marcos)
-        ]
-
-        # PREPARO la matriz únicamente para los estados de marcos:
-        matrix     = [['' for _ in range(n)] for _ in range(num_marcos)]
-        # FALLOS en una lista aparte:
-        fallos_col = [''] * n
-        total_fallos = 0
-
-        for i, page in enumerate(referencia):
-            # 1) HIT?
-            pages_in_frames = [fr['page'] for fr in frames]
-            if page in pages_in_frames:
-                # Limpio todos los bits y doy segunda vida al marco tocado
-                idx = pages_in_frames.index(page)
-                for fr in frames:
-                    fr['bit'] = False
-                frames[idx]['bit'] = True
-                fallos_col[i] = ''
-            else:
-                # MISS
-                total_fallos += 1
-                fallos_col[i] = '*'
-                # ¿Marco libre?
-                free_idx = next((j for j,fr in enumerate(frames) if fr['page'] is None), None)
-                if free_idx is not None:
-                    frames[free_idx]['page'] = page
-                    frames[free_idx]['bit'] = False
-                    frames[free_idx]['insertion_time'] = i
-                else:
-                    # FIFO puro por insertion_time
-                    orden = sorted(range(num_marcos),
-                                key=lambda j: frames[j]['insertion_time'])
-                    # Buscamos victim sin bit; si lo tiene, lo limpiamos y seguimos
-                    for victim in orden:
-                        if frames[victim]['bit']:
-                            frames[victim]['bit'] = False
-                            continue
-                        # reemplazamos aquí
-                        frames[victim]['page'] = page
-                        frames[victim]['bit'] = False
-                        frames[victim]['insertion_time'] = i
-                        break
 
-            # 2) Snapshot del estado de los marcos en la columna i
-            for f in range(num_marcos):
-                pg = frames[f]['page']
-                if pg is None:
-                    matrix[f][i] = ''
-                else:
-                    matrix[f][i] = f"{pg}{'*' if frames[f]['bit'] else ''}"
+        Con solo_estadisticas=True no se construyen matriz ni fallos_col
+        (memoria O(marcos)) y se retorna (aciertos, total_fallos, reemplazos).
 
-            # 3) Devuelvo **sólo**:
-            #    - matrix: estados de marcos (n filas x len columnas)
-            #    - fallos_col: lista de '*' o ''
-            #    - total_fallos: número
+        Con eventos=True se retorna un ResultadoEventos (cambios de página y de
+        bit de cada marco) en lugar de la matriz densa; el bit se consulta como
+        fila aparte (columna_bits / matriz_bits) y no dentro del texto.
 
-        return matrix, fallos_col, total_fallos
+        progreso: igual que en fifo.
+        """
+        referencias, valores = _paginas_y_valores(referencia)
+        # Motor con página y bit por marco; limpiar_bits=True conserva la
+        # semántica de "limpiar todos los bits en cada acierto"
+        motor = MotorSegundaOportunidad(num_marcos, limpiar_bits=True)
+        if solo_estadisticas:
+            return _estadisticas(map(motor.acceder, _recorrer(referencias, valores)))
+        paginas = motor.paginas
+        bits = motor.bits
+        # Con ids densos se registran las páginas originales
+        def mostrar(pagina):
+            if valores is None or pagina == -1:
+                return pagina
+            return int(valores[pagina])
+
+        resultado = ResultadoEventos(num_marcos, len(referencias), con_bits=True)
+        for i, page in enumerate(_recorrer(referencias, valores)):
+            if progreso is not None and i % PASO_PROGRESO == 0:
+                progreso(i, resultado.total_fallos)
+            fallo, marco, victima = motor.acceder(page)
+            if fallo:
+                # MISS
+                resultado.marcar_fallo(i)
+
+            # Solo cambian los marcos con bit limpiado y el marco tocado
+            # (página nueva, o bit en 1 si fue acierto)
+            for f in motor.limpiados:
+                if fallo and f == marco:
+                    continue
+                pg = mostrar(paginas[f])
+                resultado.registrar(i, f, pg, pg, 0)
+            if marco != -1:
+                pg = mostrar(page)
+                resultado.registrar(i, marco, pg, mostrar(victima) if fallo else pg, bits[marco])
+        if progreso is not None:
+            progreso(len(referencias), resultado.total_fallos)
+
+        if eventos:
+            return resultado
+        # La matriz densa conserva el formato "pagina*" cuando el bit está en 1
+        matrix = [
+            ['' if pg == '' else f"{pg}{'*' if bit else ''}" for pg, bit in zip(fila, fila_bits)]
+            for fila, fila_bits in zip(resultado.matriz(), resultado.matriz_bits())
+        ]
+        return matrix, resultado.fallos_col(), resultado.total_fallos
 
 
 
@@ -0,0 +1,60 @@
+# Algoritmos/barrido.py
+
+from concurrent.futures import ProcessPoolExecutor
+from Algoritmos import registro
+
+# Referencia compartida por cada proceso trabajador: se envía una sola vez al
+# crear el proceso (initializer) y no con cada tarea
+_referencia = None
+
+
+def _iniciar_trabajador(referencia):
+    global _referencia
+    _referencia = referencia
+
+
+def _contar_fallos(algoritmo, marcos, referencia=None):
+    if referencia is None:
+        referencia = _referencia
+    # El motor se resuelve por el registro (se importa en cada proceso al usarlo)
+    _, total_fallos, _ = registro.obtener(algoritmo).simular(referencia, marcos,
+                                                             solo_estadisticas=True)
+    return total_fallos
+
+
+def barrido_fifo(referencia, max_marcos, algoritmo="FIFO", procesos=None):
+    """
+    Simula FIFO (o cualquier algoritmo del registro con la capacidad
+    'estadisticas', p. ej. "FIFO MEJORADO") con 1..max_marcos marcos,
+    repartiendo cada número de marcos entre los procesos de un
+    ProcessPoolExecutor.
+
+    FIFO no es un algoritmo de pila, así que no hay curva en una sola pasada
+    como en curvas.lru_curve: cada número de marcos es una simulación
+    independiente, y por eso se paralelizan.
+
+    procesos: número de procesos (None = todos los núcleos, 1 = sin pool).
+
+    Retorna (fallos, anomalias):
+      - fallos: lista de max_marcos + 1 elementos, fallos[m] con m marcos
+        (fallos[0] = len(referencia))
+      - anomalias: números de marcos m donde fallos[m] > fallos[m - 1]
+        (anomalía de Belady)
+    """
+    if algoritmo not in registro.nombres('estadisticas'):
+        # Se valida antes de crear los procesos
+        raise ValueError("Algoritmo no reconocido")
+    lista_marcos = range(1, max_marcos + 1)
+    if procesos == 1:
+        resultados = [_contar_fallos(algoritmo, m, referencia) for m in lista_marcos]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos,
+                                 initializer=_iniciar_trabajador,
+                                 initargs=(referencia,)) as pool:
+            # Los números de marcos grandes tardan más: se reparten de a uno
+            resultados = list(pool.map(_contar_fallos,
+                                       [algoritmo] * max_marcos, lista_marcos))
+
+    fallos = [len(referencia)] + resultados
+    anomalias = [m for m in range(2, max_marcos + 1) if fallos[m] > fallos[m - 1]]
+    return fallos, anomalias
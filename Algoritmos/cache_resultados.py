@@ -0,0 +1,119 @@
+# Algoritmos/cache_resultados.py
+
+import hashlib
+import os
+import pickle
+from array import array
+from Algoritmos.resultado import ResultadoEventos
+from Algoritmos.traza import BLOQUE, Traza
+
+# Cambiar cuando un motor cambie sus resultados, para no reutilizar los viejos
+VERSION_MOTOR = 1
+# Tipo de salida de la simulación -> clase que debe tener el resultado
+# guardado (eventos=True, matriz densa, solo_estadisticas=True)
+TIPOS = {"eventos": ResultadoEventos, "matriz": tuple, "estadisticas": tuple}
+
+
+class CacheResultados:
+    """
+    Caché en disco de resultados de simulación, direccionada por contenido:
+    la clave es un hash de (versión del motor, algoritmo, marcos, tipo de
+    salida, referencia), así que la misma combinación se reutiliza entre la
+    GUI y los scripts sin confundir, p. ej., un ResultadoEventos con la
+    tupla de solo_estadisticas. 'tipo' es una clave de TIPOS.
+
+    Cada resultado (normalmente un ResultadoEventos, que es compacto) se
+    guarda en un archivo <clave>.pkl. El tamaño total se limita a max_bytes
+    expulsando los archivos usados hace más tiempo (LRU por fecha de
+    modificación, que se actualiza en cada acierto).
+
+    aciertos_cache / fallos_cache cuentan las consultas resueltas desde el
+    disco y las que hubo que calcular.
+    """
+
+    def __init__(self, directorio=None, max_bytes=256 * 1024 * 1024):
+        if directorio is None:
+            directorio = os.path.join(os.path.expanduser("~"), ".cache", "algoritmos_reemplazo")
+        self.directorio = directorio
+        self.max_bytes = max_bytes
+        self.aciertos_cache = 0
+        self.fallos_cache = 0
+        os.makedirs(directorio, exist_ok=True)
+
+    def clave(self, referencia, marcos, algoritmo, tipo="eventos"):
+        if tipo not in TIPOS:
+            raise ValueError(f"Tipo de resultado no reconocido: {tipo}")
+        h = hashlib.sha256()
+        h.update(f"{VERSION_MOTOR}|{algoritmo}|{marcos}|{tipo}|".encode())
+        if isinstance(referencia, Traza):
+            # Páginas originales por bloques, sin copiar la traza entera
+            ids, valores = referencia.ids, referencia.valores
+            for i in range(0, len(ids), BLOQUE):
+                h.update(valores[ids[i:i + BLOQUE]].astype('int64').tobytes())
+        else:
+            h.update(array('q', referencia).tobytes())
+        return h.hexdigest()
+
+    def obtener(self, referencia, marcos, algoritmo, tipo="eventos"):
+        """Retorna el resultado guardado o None si no está (o no es del tipo pedido)."""
+        ruta = self._ruta(self.clave(referencia, marcos, algoritmo, tipo))
+        try:
+            with open(ruta, 'rb') as archivo:
+                resultado = pickle.load(archivo)
+            # Marca el archivo como usado recientemente (si otro proceso lo
+            # expulsó entre medio, es un fallo más)
+            os.utime(ruta)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if not isinstance(resultado, TIPOS[tipo]):
+            return None
+        return resultado
+
+    def guardar(self, referencia, marcos, algoritmo, resultado, tipo="eventos"):
+        ruta = self._ruta(self.clave(referencia, marcos, algoritmo, tipo))
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, 'wb') as archivo:
+            pickle.dump(resultado, archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, ruta)
+        self._expulsar()
+
+    def resultado(self, referencia, marcos, algoritmo, calcular, tipo="eventos"):
+        """
+        Retorna el resultado de (referencia, marcos, algoritmo) desde el disco
+        o, si no está, lo obtiene llamando a calcular() y lo guarda. 'tipo'
+        debe corresponder a lo que retorna calcular(). Si no se puede
+        escribir en el disco, el resultado se retorna igual, sin guardarlo.
+        """
+        resultado = self.obtener(referencia, marcos, algoritmo, tipo)
+        if resultado is not None:
+            self.aciertos_cache += 1
+            return resultado
+        self.fallos_cache += 1
+        resultado = calcular()
+        try:
+            self.guardar(referencia, marcos, algoritmo, resultado, tipo)
+        except OSError:
+            pass
+        return resultado
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, f"{clave}.pkl")
+
+    def _expulsar(self):
+        # Archivos de la caché del más antiguo al más reciente
+        archivos = []
+        total = 0
+        for entrada in os.scandir(self.directorio):
+            if entrada.name.endswith('.pkl'):
+                info = entrada.stat()
+                archivos.append((info.st_mtime, info.st_size, entrada.path))
+                total += info.st_size
+        archivos.sort()
+        for _, tamano, ruta in archivos:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(ruta)
+            except OSError:
+                continue
+            total -= tamano
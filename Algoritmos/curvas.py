@@ -0,0 +1,136 @@
+# Algoritmos/curvas.py
+
+from array import array
+from Algoritmos.motor_optimo import siguiente_uso
+from Algoritmos.traza import Traza, en_bloques
+
+
+def lru_curve(referencia, max_marcos):
+    """
+    Fallos de LRU para todos los números de marcos de 0 a max_marcos en una
+    sola pasada (algoritmo de pila de Mattson).
+
+    LRU cumple la propiedad de inclusión: con m marcos, una referencia es
+    acierto si y solo si su distancia de pila (cuántas páginas distintas se
+    usaron desde su último uso, contándola a ella) es <= m. Esa distancia se
+    obtiene con un árbol de Fenwick sobre los instantes de tiempo, donde se
+    marca con 1 la última referencia de cada página: O(n log n) en total.
+
+    Con una Traza se usa el prev_use de su TraceIndex en lugar de calcularlo.
+
+    Retorna una lista 'fallos' de max_marcos + 1 elementos:
+      fallos[m] = número de fallos de página de LRU con m marcos.
+    """
+    n = len(referencia)
+    # anterior[t] = instante de la referencia anterior a la misma página (-1 si no hay)
+    if isinstance(referencia, Traza):
+        anterior = en_bloques(referencia.indice.prev_use)
+    else:
+        anterior = [-1] * n
+        ultima = {}
+        for t, pagina in enumerate(referencia):
+            anterior[t] = ultima.get(pagina, -1)
+            ultima[pagina] = t
+    arbol = array('q', bytes(8 * (n + 1)))   # árbol de Fenwick (índices 1..n)
+    # histograma[d] = referencias con distancia de pila d (1 <= d <= max_marcos)
+    histograma = [0] * (max_marcos + 1)
+
+    for t, j in enumerate(anterior):
+        if j != -1:
+            # Páginas distintas usadas después de j = marcas en (j, t)
+            distancia = 1
+            i = t
+            while i > 0:
+                distancia += arbol[i]
+                i -= i & -i
+            i = j + 1
+            while i > 0:
+                distancia -= arbol[i]
+                i -= i & -i
+            if distancia <= max_marcos:
+                histograma[distancia] += 1
+            # La última referencia de la página deja de ser la de j
+            i = j + 1
+            while i <= n:
+                arbol[i] -= 1
+                i += i & -i
+        i = t + 1
+        while i <= n:
+            arbol[i] += 1
+            i += i & -i
+
+    fallos = [n] * (max_marcos + 1)
+    aciertos = 0
+    for m in range(1, max_marcos + 1):
+        aciertos += histograma[m]
+        fallos[m] = n - aciertos
+    return fallos
+
+
+def optimo_curve(referencia, max_marcos, siguiente=None):
+    """
+    Fallos del algoritmo Óptimo para todos los números de marcos de 0 a
+    max_marcos en una sola pasada (pila de prioridades de Mattson).
+
+    Óptimo también cumple la propiedad de inclusión si la prioridad de cada
+    página es su próximo uso (más pronto = más prioridad). La pila se actualiza
+    así al referenciar x: x pasa al tope y, bajando hasta la posición anterior
+    de x, en cada nivel se queda la página de más prioridad entre la que
+    estaba y la que viene "cargada" desde arriba; la otra sigue bajando.
+    Solo hace falta guardar las max_marcos primeras posiciones: O(n * max_marcos).
+
+    siguiente: índice de próximos usos ya calculado (ver
+    motor_optimo.siguiente_uso); si no se da, se toma el next_use del
+    TraceIndex de la Traza o se calcula aquí.
+
+    Retorna una lista 'fallos' de max_marcos + 1 elementos:
+      fallos[m] = número de fallos de página de Óptimo con m marcos.
+    """
+    n = len(referencia)
+    if isinstance(referencia, Traza):
+        if siguiente is None:
+            siguiente = referencia.indice.next_use
+        # Ids y próximos usos por bloques, sin listas del tamaño de la traza
+        siguiente = en_bloques(siguiente)
+        referencia = en_bloques(referencia.ids)
+    elif siguiente is None:
+        siguiente = siguiente_uso(referencia)
+    pila = []       # pila de páginas, pila[0] = tope
+    proximo = {}    # página -> próximo uso tras la referencia actual
+    # histograma[d] = referencias halladas en la posición d (1-based) de la pila
+    histograma = [0] * (max_marcos + 1)
+
+    for pagina, proximo_uso in zip(referencia, siguiente):
+        proximo[pagina] = proximo_uso
+        try:
+            posicion = pila.index(pagina)
+        except ValueError:
+            posicion = -1
+        else:
+            histograma[posicion + 1] += 1
+            if posicion == 0:
+                continue
+
+        if not pila:
+            if max_marcos > 0:
+                pila.append(pagina)
+            continue
+
+        cargada = pila[0]
+        pila[0] = pagina
+        limite = posicion if posicion != -1 else len(pila)
+        for i in range(1, limite):
+            # Se queda en el nivel i la de próximo uso más cercano
+            if proximo[cargada] < proximo[pila[i]]:
+                cargada, pila[i] = pila[i], cargada
+        if posicion != -1:
+            pila[posicion] = cargada
+        elif len(pila) < max_marcos:
+            pila.append(cargada)
+
+    fallos = [n] * (max_marcos + 1)
+    aciertos = 0
+    for m in range(1, max_marcos + 1):
+        aciertos += histograma[m]
+        fallos[m] = n - aciertos
+    return fallos
@@ -0,0 +1,201 @@
+# Algoritmos/direcciones.py
+
+# Ingesta de trazas de direcciones virtuales (bytes) para convertirlas en
+# trazas de páginas. Formatos aceptados, línea por línea:
+#
+#   - estilo Valgrind lackey:  "I  04000000,3"  " L 04222cac,8"
+#                              " S 7ff000398,8" " M 0421d7f0,4"
+#   - volcado crudo:           "7ff000398" o "0x7ff000398"
+#
+# Las demás líneas se ignoran, aunque empiecen con una letra de tipo o un
+# dígito hexadecimal:
+#
+#   "==1234== Memcheck ..."   (cabeceras de Valgrind)
+#   "Start of trace", "done"  (no hay blanco tras la 'S' / "done" no es hex)
+#   "I",  " L zz,4"           (con tipo pero sin dirección)
+#   "7ff000398 ok"            (cruda con texto después de la dirección)
+
+# Código de tipo de cada acceso (byte ASCII); los volcados crudos no traen tipo
+INSTRUCCION, LECTURA, ESCRITURA, MODIFICACION, SIN_TIPO = b"ILSM?"
+MAX_DIGITOS_HEX = 16
+
+
+def _tablas():
+    import numpy as np
+
+    valor_hex = np.full(256, -1, dtype=np.int16)
+    for i, c in enumerate(b"0123456789abcdef"):
+        valor_hex[c] = i
+    for i, c in enumerate(b"ABCDEF"):
+        valor_hex[c] = 10 + i
+    es_tipo = np.zeros(256, dtype=bool)
+    es_tipo[np.frombuffer(b"ILSM", dtype=np.uint8)] = True
+    return valor_hex, es_tipo
+
+
+def _leer_lineas(datos, desplazamiento=0):
+    """
+    Convierte un bloque de líneas completas (bytes) en (direcciones uint64,
+    tipos uint8), vectorizado como leer_numeros pero en base 16. Solo se
+    aceptan dos formas de línea (con blancos al principio):
+
+      - con tipo: letra I/L/S/M, blanco(s) y la dirección, terminada en ',',
+        blanco o fin de línea (" L 04222cac,8")
+      - cruda: solo la dirección y blancos ("7ff000398")
+
+    Las demás líneas se ignoran: la dirección no se busca en cualquier parte
+    de la línea, así "Start of trace" o "done" no se leen como accesos.
+    """
+    import numpy as np
+
+    valor_hex, es_tipo = _tablas()
+    # "0x" se descarta para que no parta la dirección en dos números; el
+    # '\n' agregado al final asegura que siempre haya un carácter después
+    # de cada posición que se consulta
+    datos = np.frombuffer(datos.replace(b"0x", b"  ").replace(b"0X", b"  ") + b"\n",
+                          dtype=np.uint8)
+    valores = valor_hex[datos]
+    es_hex = valores >= 0
+    es_blanco = (datos == ord(' ')) | (datos == ord('\t')) | (datos == ord('\r'))
+    # Caracteres que pueden seguir a la dirección en una línea con tipo
+    termina = np.zeros(256, dtype=bool)
+    termina[np.frombuffer(b", \t\r\n", dtype=np.uint8)] = True
+
+    # Números hexadecimales = tramos de dígitos hex
+    inicio = np.flatnonzero(es_hex & ~np.concatenate(([False], es_hex[:-1])))
+    fin = np.flatnonzero(es_hex & ~np.concatenate((es_hex[1:], [False]))) + 1
+
+    # Primer carácter no blanco de cada línea. El '\n' cuenta como no blanco,
+    # así nunca se pasa a la línea siguiente (una línea vacía "empieza" con
+    # su '\n' y no es válida)
+    inicio_linea = np.concatenate(([0], np.flatnonzero(datos == ord('\n')) + 1))
+    no_blanco = np.flatnonzero(~es_blanco)
+    primero = np.searchsorted(no_blanco, inicio_linea)
+    primero = no_blanco[primero[primero < len(no_blanco)]]
+    siguiente = np.minimum(primero + 1, len(datos) - 1)
+    con_tipo = es_tipo[datos[primero]] & es_blanco[siguiente]
+    tipos = np.where(con_tipo, datos[primero], SIN_TIPO).astype(np.uint8)
+
+    # La dirección empieza después de los blancos que siguen al tipo, o en
+    # el primer carácter si la línea es cruda
+    despues_tipo = no_blanco[np.searchsorted(no_blanco, siguiente)]
+    pos = np.where(con_tipo, despues_tipo, primero)
+    valida = es_hex[pos]
+    # Como pos sigue a un blanco o empieza la línea, es el inicio de un tramo
+    tramo = np.minimum(np.searchsorted(inicio, pos), max(len(inicio) - 1, 0))
+    fin_direccion = fin[tramo] if len(inicio) else pos
+    # Con tipo: después de la dirección viene ',', blanco o fin de línea.
+    # Cruda: después de la dirección solo blancos hasta el fin de línea
+    resto = datos[no_blanco[np.searchsorted(no_blanco, fin_direccion)]]
+    valida &= np.where(con_tipo, termina[datos[fin_direccion]], resto == ord('\n'))
+
+    tipos = tipos[valida]
+    inicio, fin = inicio[tramo[valida]], fin_direccion[valida]
+    largo = fin - inicio
+    if largo.max(initial=0) > MAX_DIGITOS_HEX:
+        malo = inicio[np.argmax(largo)]
+        raise ValueError(f"Dirección de más de 64 bits en la posición {desplazamiento + malo}")
+
+    # Por columnas de dígitos, como en leer_numeros
+    direcciones = np.zeros(len(inicio), dtype=np.uint64)
+    activos = np.arange(len(inicio))
+    k = 0
+    while len(activos):
+        digito = valores[inicio[activos] + k].astype(np.uint64)
+        direcciones[activos] = (direcciones[activos] << np.uint64(4)) | digito
+        k += 1
+        activos = activos[largo[activos] > k]
+    return direcciones, tipos
+
+
+def bloques_direcciones(ruta, tamano_pagina=4096, tipos=None, colapsar=False):
+    """
+    Genera (paginas int64, tipos uint8) trozo a trozo a partir de una traza
+    de direcciones (comprimida o no, ver lector_trazas.abrir).
+
+    tamano_pagina -- potencia de 2; la página es direccion >> log2(tamano)
+    tipos         -- si se da (p. ej. b"LSM"), solo esos accesos; los
+                     volcados crudos tienen tipo SIN_TIPO ('?')
+    colapsar      -- si True, accesos consecutivos a la misma página cuentan
+                     como una sola referencia (también entre trozos)
+    """
+    import numpy as np
+    from Algoritmos.lector_trazas import _trozos
+
+    if tamano_pagina <= 0 or tamano_pagina & (tamano_pagina - 1):
+        raise ValueError("El tamaño de página debe ser una potencia de 2")
+    desplazamiento_pagina = np.uint64(tamano_pagina.bit_length() - 1)
+    filtro = None if tipos is None else np.frombuffer(bytes(tipos), dtype=np.uint8)
+
+    posicion = 0                # posición en el archivo del trozo actual
+    anterior = None             # última página emitida (para colapsar)
+    for trozo in _trozos_completos(_trozos(ruta)):
+        direcciones, tipo = _leer_lineas(trozo, posicion)
+        posicion += len(trozo)
+        if filtro is not None:
+            conservar = np.isin(tipo, filtro)
+            direcciones, tipo = direcciones[conservar], tipo[conservar]
+        paginas = (direcciones >> desplazamiento_pagina).astype(np.int64)
+        if colapsar and len(paginas):
+            cambia = np.ones(len(paginas), dtype=bool)
+            cambia[1:] = paginas[1:] != paginas[:-1]
+            cambia[0] = paginas[0] != anterior
+            paginas, tipo = paginas[cambia], tipo[cambia]
+        if len(paginas):
+            anterior = paginas[-1]
+            yield paginas, tipo
+
+
+def _trozos_completos(trozos):
+    # Reagrupa los trozos para que cada uno termine en un fin de línea
+    pendiente = b""
+    for trozo in trozos:
+        datos = pendiente + trozo
+        corte = datos.rfind(b"\n") + 1
+        if corte:
+            yield datos[:corte]
+        pendiente = datos[corte:]
+    if pendiente:
+        yield pendiente
+
+
+def paginas_direcciones(ruta, tamano_pagina=4096, tipos=None, colapsar=False):
+    """Generador de páginas (int de Python) para los motores en flujo."""
+    for paginas, _ in bloques_direcciones(ruta, tamano_pagina, tipos, colapsar):
+        yield from paginas.tolist()
+
+
+def cargar_direcciones(ruta, tamano_pagina=4096, tipos=None, colapsar=False):
+    """Traza de páginas (Traza, ids densos) de una traza de direcciones."""
+    import numpy as np
+    from Algoritmos.traza import Traza
+
+    partes = [p for p, _ in bloques_direcciones(ruta, tamano_pagina, tipos, colapsar)]
+    return Traza.desde(np.concatenate(partes) if partes else np.zeros(0, dtype=np.int64))
+
+
+def convertir_direcciones(ruta_origen, ruta_destino, tamano_pagina=4096, tipos=None,
+                          colapsar=False):
+    """
+    Escribe la traza de páginas en formato compacto .trz (traza_compacta.py),
+    sin cargar la traza de direcciones entera. Retorna las referencias escritas.
+    """
+    from Algoritmos.traza_compacta import escribir_compacta
+
+    bloques = bloques_direcciones(ruta_origen, tamano_pagina, tipos, colapsar)
+    return escribir_compacta(ruta_destino, (paginas for paginas, _ in bloques))
+
+
+# ------------------ EJEMPLO DE USO ------------------
+# valgrind --tool=lackey --trace-mem=yes prog 2> prog.lackey
+# python -m Algoritmos.direcciones prog.lackey prog.trz 4096 --colapsar
+if __name__ == "__main__":
+    import sys
+
+    argumentos = [a for a in sys.argv[1:] if a != "--colapsar"]
+    if len(argumentos) not in (2, 3):
+        sys.exit("Uso: python -m Algoritmos.direcciones ORIGEN DESTINO.trz [TAMANO_PAGINA] [--colapsar]")
+    tamano = int(argumentos[2]) if len(argumentos) == 3 else 4096
+    total = convertir_direcciones(argumentos[0], argumentos[1], tamano,
+                                  colapsar="--colapsar" in sys.argv)
+    print("Referencias:", total)
@@ -0,0 +1,71 @@
+# Algoritmos/flujo.py
+
+import sys
+from Algoritmos.motor_fifo import MotorFIFO
+from Algoritmos.motor_lru import MotorLRU
+from Algoritmos.motor_segunda_oportunidad import MotorSegundaOportunidad
+
+
+def _flujo(motor, paginas):
+    for t, pagina in enumerate(paginas):
+        fallo, marco, victima = motor.acceder(pagina)
+        yield t, pagina, fallo, marco, victima
+
+
+def fifo_flujo(paginas, marcos):
+    """
+    Versión en flujo de FIFO: consume cualquier iterable de páginas (lista,
+    archivo, tubería...) sin conocer su largo y produce un evento por referencia:
+
+        (t, pagina, fallo, marco, victima)
+
+    con victima = -1 si no hubo reemplazo. La memoria usada es O(marcos).
+    """
+    return _flujo(MotorFIFO(marcos), paginas)
+
+
+def lru_flujo(paginas, marcos):
+    """Versión en flujo de LRU (mismos eventos que fifo_flujo)."""
+    return _flujo(MotorLRU(marcos), paginas)
+
+
+def segunda_oportunidad_flujo(paginas, marcos, limpiar_bits=False):
+    """
+    Versión en flujo de FIFO + segunda oportunidad (mismos eventos que
+    fifo_flujo). limpiar_bits=True usa la semántica de Algoritmos.fifo_mejorado;
+    por defecto es el reloj clásico.
+    """
+    return _flujo(MotorSegundaOportunidad(marcos, limpiar_bits), paginas)
+
+
+def fifo_mejorado_flujo(paginas, marcos):
+    """segunda_oportunidad_flujo con la semántica de Algoritmos.fifo_mejorado."""
+    return segunda_oportunidad_flujo(paginas, marcos, limpiar_bits=True)
+
+
+def paginas_de_texto(lineas):
+    """Páginas enteras separadas por espacios/saltos de línea, una a una."""
+    for linea in lineas:
+        for token in linea.split():
+            yield int(token)
+
+
+# ------------------ EJEMPLO DE USO ------------------
+# python -m Algoritmos.flujo LRU 64 < traza.txt
+if __name__ == "__main__":
+    from Algoritmos import registro
+
+    algoritmo = sys.argv[1].upper() if len(sys.argv) > 1 else "FIFO"
+    marcos = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    if algoritmo not in registro.nombres('flujo'):
+        sys.exit(f"Algoritmos disponibles en flujo: {', '.join(registro.nombres('flujo'))}")
+
+    referencias = fallos = 0
+    politica = registro.obtener(algoritmo)
+    for _, _, fallo, _, _ in politica.flujo(paginas_de_texto(sys.stdin), marcos):
+        referencias += 1
+        fallos += fallo
+
+    print(f"Algoritmo: {algoritmo}  Marcos: {marcos}")
+    print("Referencias:", referencias)
+    print("Total de fallos:", fallos)
@@ -0,0 +1,43 @@
+# Algoritmos/indice_traza.py
+
+import numpy as np
+
+
+class TraceIndex:
+    """
+    Índice de una referencia calculado una sola vez con NumPy y compartido
+    por los motores que lo necesitan (Óptimo, curvas de LRU/Óptimo, ...):
+
+      - next_use[t]   próximo instante con la misma página, o n si no vuelve
+      - prev_use[t]   instante anterior con la misma página, o -1 si es la primera
+      - first_touch[t] True si t es la primera referencia a su página
+      - ocurrencias[id] número de referencias a cada página (ids densos)
+
+    Se arma ordenando las posiciones por página con un argsort estable (dentro
+    de cada página quedan en orden de tiempo) y comparando cada posición con
+    la siguiente del mismo grupo, sin recorrer la referencia en Python.
+    """
+
+    def __init__(self, ids, num_paginas=None):
+        """
+        ids         -- arreglo con el id de página de cada referencia
+        num_paginas -- cantidad de ids distintos (para 'ocurrencias'); si no
+                       se da, se toma max(ids) + 1
+        """
+        ids = np.asarray(ids)
+        n = len(ids)
+        orden = np.argsort(ids, kind='stable')
+        agrupados = ids[orden]
+        # misma[k] = las posiciones orden[k] y orden[k + 1] son de la misma página
+        misma = agrupados[1:] == agrupados[:-1]
+        desde = orden[:-1][misma]
+        hasta = orden[1:][misma]
+
+        self.next_use = np.full(n, n, dtype=np.int64)
+        self.next_use[desde] = hasta
+        self.prev_use = np.full(n, -1, dtype=np.int64)
+        self.prev_use[hasta] = desde
+        self.first_touch = self.prev_use == -1
+        if num_paginas is None:
+            num_paginas = int(ids.max()) + 1 if n else 0
+        self.ocurrencias = np.bincount(ids, minlength=num_paginas)
@@ -0,0 +1,221 @@
+# Algoritmos/lector_trazas.py
+
+import bz2
+import gzip
+import lzma
+import os
+
+# Páginas por bloque al recorrer un archivo binario como flujo
+BLOQUE = 1 << 16
+# Bytes por lectura de un archivo de texto o comprimido
+TROZO = 1 << 22
+
+# Formatos binarios: páginas sin signo little-endian, una tras otra
+_TIPOS_BINARIOS = {"uint32": "<u4", "uint64": "<u8"}
+# Extensión -> formato (lo demás se lee como texto); "compacta" es el .trz
+# de traza_compacta.py y "direcciones" una traza de direcciones virtuales
+# (direcciones.py, páginas de 4 KiB)
+_EXTENSIONES = {".u32": "uint32", ".bin": "uint32", ".u64": "uint64", ".trz": "compacta",
+                ".lackey": "direcciones"}
+
+# Compresión reconocida por los primeros bytes del archivo (no por la extensión)
+_COMPRESIONES = {
+    b"\x1f\x8b": gzip.open,
+    b"\xfd7zXZ\x00": lzma.open,
+    b"BZh": bz2.open,
+}
+_EXTENSIONES_COMPRESION = (".gz", ".xz", ".bz2")
+
+
+def compresion_de(ruta):
+    """Función de apertura (gzip.open, lzma.open, bz2.open) o None si no está comprimido."""
+    with open(ruta, 'rb') as archivo:
+        inicio = archivo.read(6)
+    for magia, abrir in _COMPRESIONES.items():
+        if inicio.startswith(magia):
+            return abrir
+    return None
+
+
+def abrir(ruta):
+    """Abre la traza en binario, descomprimiéndola al vuelo si hace falta."""
+    descomprimir = compresion_de(ruta)
+    if descomprimir is None:
+        return open(ruta, 'rb', buffering=TROZO)
+    return descomprimir(ruta, 'rb')
+
+
+def formato_de(ruta):
+    """Formato de la traza según la extensión ("traza.u64.gz" -> "uint64")."""
+    base, extension = os.path.splitext(ruta)
+    if extension.lower() in _EXTENSIONES_COMPRESION:
+        extension = os.path.splitext(base)[1]
+    return _EXTENSIONES.get(extension.lower(), "texto")
+
+
+def _trozos(ruta):
+    with abrir(ruta) as archivo:
+        while True:
+            trozo = archivo.read(TROZO)
+            if not trozo:
+                return
+            yield trozo
+
+
+def bloques_texto(ruta):
+    """
+    Arreglos int64 con las páginas de una traza de texto, trozo a trozo: los
+    números pueden ir separados por espacios, comas, ';' o saltos de línea.
+    Cada trozo se corta en el último separador y se convierte de una vez con
+    leer_numeros; nunca se tiene el archivo completo en memoria.
+    """
+    from Algoritmos.referencias import MAX_DIGITOS, SEPARADORES, ReferenciasInvalidas, leer_numeros
+
+    pendiente = b""
+    desplazamiento = 0          # posición en el archivo del inicio de 'pendiente'
+    for trozo in _trozos(ruta):
+        datos = pendiente + trozo
+        corte = max(datos.rfind(bytes([s])) for s in SEPARADORES) + 1
+        if corte:
+            try:
+                yield leer_numeros(datos[:corte])
+            except ReferenciasInvalidas as e:
+                raise ReferenciasInvalidas([(desplazamiento + p, t) for p, t in e.errores]) from None
+            desplazamiento += corte
+        # Lo que sigue al último separador continúa en el próximo trozo; si ya
+        # es más largo que cualquier número válido, no se sigue acumulando
+        pendiente = datos[corte:]
+        if len(pendiente) > MAX_DIGITOS:
+            token = pendiente[:MAX_DIGITOS + 1].decode('latin-1')
+            if len(pendiente) > MAX_DIGITOS + 1:
+                token += "..."
+            raise ReferenciasInvalidas([(desplazamiento, token)])
+    if pendiente:
+        try:
+            yield leer_numeros(pendiente)
+        except ReferenciasInvalidas as e:
+            raise ReferenciasInvalidas([(desplazamiento + p, t) for p, t in e.errores]) from None
+
+
+def leer_texto(ruta):
+    """Generador de páginas (int de Python) de una traza de texto."""
+    for bloque in bloques_texto(ruta):
+        yield from bloque.tolist()
+
+
+def leer_binario(ruta, formato="uint32"):
+    """
+    Traza binaria como np.memmap de solo lectura: no se copia nada, el
+    sistema operativo trae del disco solo las partes que se recorren.
+    Un archivo comprimido no se puede mapear: usar bloques_binario.
+    """
+    import numpy as np
+
+    if compresion_de(ruta) is not None:
+        raise ValueError(f"{ruta}: está comprimido, no se puede mapear en memoria")
+    tipo = np.dtype(_TIPOS_BINARIOS[formato])
+    tamano = os.path.getsize(ruta)
+    if tamano % tipo.itemsize:
+        raise ValueError(f"{ruta}: el tamaño no es múltiplo de {tipo.itemsize} bytes ({formato})")
+    if tamano == 0:
+        # np.memmap no acepta archivos vacíos
+        return np.zeros(0, dtype=tipo)
+    return np.memmap(ruta, dtype=tipo, mode='r')
+
+
+def bloques_binario(ruta, formato="uint32"):
+    """
+    Arreglos de a lo sumo BLOQUE páginas de una traza binaria: cortes del
+    memmap si el archivo está sin comprimir, o trozos descomprimidos si no.
+    """
+    import numpy as np
+
+    if compresion_de(ruta) is None:
+        datos = leer_binario(ruta, formato)
+        for inicio in range(0, len(datos), BLOQUE):
+            yield datos[inicio:inicio + BLOQUE]
+        return
+    tipo = np.dtype(_TIPOS_BINARIOS[formato])
+    pendiente = b""
+    with abrir(ruta) as archivo:
+        while True:
+            trozo = archivo.read(BLOQUE * tipo.itemsize)
+            if not trozo:
+                break
+            datos = pendiente + trozo
+            completos = len(datos) - len(datos) % tipo.itemsize
+            yield np.frombuffer(datos[:completos], dtype=tipo)
+            pendiente = datos[completos:]
+    if pendiente:
+        raise ValueError(f"{ruta}: el tamaño no es múltiplo de {tipo.itemsize} bytes ({formato})")
+
+
+def bloques(ruta, formato=None):
+    """Arreglos de páginas de cualquier traza, bloque a bloque."""
+    formato = formato or formato_de(ruta)
+    if formato == "texto":
+        return bloques_texto(ruta)
+    if formato == "direcciones":
+        from Algoritmos.direcciones import bloques_direcciones
+
+        return (paginas for paginas, _ in bloques_direcciones(ruta))
+    if formato == "compacta":
+        from Algoritmos.traza_compacta import TrazaCompacta
+
+        if compresion_de(ruta) is not None:
+            raise ValueError(f"{ruta}: una traza .trz debe estar sin comprimir (usa su índice)")
+        return TrazaCompacta(ruta).bloques()
+    return bloques_binario(ruta, formato)
+
+
+def paginas(ruta, formato=None):
+    """
+    Generador de páginas (int de Python) de cualquier traza, comprimida o
+    no, para los motores en flujo (flujo.py) y Simulador.extend: memoria
+    acotada por el tamaño de un bloque sin importar el tamaño del archivo.
+
+        for evento in lru_flujo(paginas("traza.u64.gz"), 64): ...
+    """
+    for bloque in bloques(ruta, formato):
+        yield from bloque.tolist()
+
+
+def _ventana(bloques, inicio, fin):
+    # Recorta el flujo de bloques a las posiciones [inicio, fin)
+    posicion = 0
+    for bloque in bloques:
+        if fin is not None and posicion >= fin:
+            return
+        desde = max(inicio - posicion, 0)
+        hasta = len(bloque) if fin is None else min(fin - posicion, len(bloque))
+        if desde < hasta:
+            yield bloque[desde:hasta]
+        posicion += len(bloque)
+
+
+def cargar_traza(ruta, formato=None, inicio=0, cantidad=None):
+    """
+    Carga una traza (o la ventana [inicio, inicio + cantidad) de ella) como
+    Traza (ids densos int32 + páginas distintas), lista para Algoritmos, las
+    curvas y el lote. Los binarios se compactan directo desde el memmap, los
+    .trz decodifican solo los bloques de la ventana y los de texto o
+    comprimidos se leen por bloques a arreglos, nunca a una lista de Python.
+    """
+    import numpy as np
+    from Algoritmos.traza import Traza
+
+    formato = formato or formato_de(ruta)
+    fin = None if cantidad is None else inicio + cantidad
+    comprimido = compresion_de(ruta) is not None
+    if formato == "compacta" and not comprimido:
+        from Algoritmos.traza_compacta import TrazaCompacta
+
+        compacta = TrazaCompacta(ruta)
+        datos = compacta.leer(inicio, len(compacta) if cantidad is None else cantidad)
+    elif formato in _TIPOS_BINARIOS and not comprimido:
+        datos = leer_binario(ruta, formato)[inicio:fin]
+    else:
+        # Sin índice (texto o comprimido): hay que leer el prefijo
+        partes = list(_ventana(bloques(ruta, formato), inicio, fin))
+        datos = np.concatenate(partes) if partes else np.zeros(0, dtype=np.int64)
+    return Traza.desde(datos)
@@ -0,0 +1,87 @@
+# Algoritmos/lote.py
+
+from concurrent.futures import ProcessPoolExecutor
+from Algoritmos import registro
+from Algoritmos.traza import Traza
+
+# Trazas compartidas por cada proceso trabajador (se envían una sola vez)
+_trazas = None
+
+
+def _iniciar_trabajador(trazas):
+    global _trazas
+    _trazas = trazas
+
+
+def _tarea(i, algoritmo, marcos, trazas=None):
+    """
+    Ejecuta una tarea del lote sobre la traza i. Si el algoritmo tiene curva,
+    'marcos' es el máximo y se retorna la curva completa; si no, se retorna
+    el número de fallos con esos marcos.
+    """
+    traza = (trazas if trazas is not None else _trazas)[i]
+    politica = registro.obtener(algoritmo)
+    if 'curva' in politica.capacidades:
+        return politica.curva(traza, marcos)
+    return politica.simular(traza, marcos, solo_estadisticas=True)[1]
+
+
+def simular_lote(trazas, lista_marcos, algoritmos, procesos=None):
+    """
+    Simula todas las combinaciones traza x marcos x algoritmo en una llamada.
+
+    trazas       -- lista de referencias (listas de páginas o Traza)
+    lista_marcos -- números de marcos a probar
+    algoritmos   -- nombres del registro (registro.nombres())
+    procesos     -- procesos del ProcessPoolExecutor (None = todos los
+                    núcleos, 1 = sin pool)
+
+    El trabajo común se hace una sola vez por traza: la compactación a ids
+    densos (Traza) y su TraceIndex se calculan antes de repartir, y los
+    algoritmos con capacidad 'curva' (LRU, OPTIMO) se resuelven con una sola
+    curva para el máximo de marcos en lugar de una simulación por número de
+    marcos.
+
+    Retorna una lista de filas {'traza', 'algoritmo', 'marcos', 'fallos'},
+    ordenada por traza, algoritmo (en el orden dado) y marcos.
+    """
+    # Algoritmos de pila: una sola pasada da los fallos para todos los marcos
+    con_curva = {a for a in algoritmos if 'curva' in registro.obtener(a).capacidades}
+
+    trazas = [t if isinstance(t, Traza) else Traza.desde(t) for t in trazas]
+    if con_curva:
+        for traza in trazas:
+            traza.indice  # se calcula aquí y viaja ya hecho a los procesos
+
+    max_marcos = max(lista_marcos, default=0)
+    tareas = []
+    for i in range(len(trazas)):
+        for algoritmo in algoritmos:
+            if algoritmo in con_curva:
+                tareas.append((i, algoritmo, max_marcos))
+            else:
+                tareas.extend((i, algoritmo, m) for m in lista_marcos)
+
+    if procesos == 1:
+        salidas = [_tarea(i, a, m, trazas) for i, a, m in tareas]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos,
+                                 initializer=_iniciar_trabajador,
+                                 initargs=(trazas,)) as pool:
+            salidas = list(pool.map(_tarea, *zip(*tareas))) if tareas else []
+
+    # Tabla ordenada: una fila por traza x algoritmo x marcos
+    fallos = {}
+    for (i, algoritmo, m), salida in zip(tareas, salidas):
+        if algoritmo in con_curva:
+            for marcos in lista_marcos:
+                fallos[i, algoritmo, marcos] = salida[marcos]
+        else:
+            fallos[i, algoritmo, m] = salida
+
+    return [
+        {'traza': i, 'algoritmo': algoritmo, 'marcos': m, 'fallos': fallos[i, algoritmo, m]}
+        for i in range(len(trazas))
+        for algoritmo in algoritmos
+        for m in sorted(lista_marcos)
+    ]
@@ -0,0 +1,60 @@
+# Algoritmos/motor_fifo.py
+
+from Algoritmos.residencia import Residencia, residencia_densa
+
+
+class MotorFIFO:
+    """
+    Motor FIFO con costo O(1) por referencia, sin importar el número de marcos.
+
+    La residencia se consulta en un diccionario página -> marco en lugar de
+    'pagina in frames', y el marco a reemplazar lo indica un puntero circular:
+    como las páginas entran en orden 0, 1, 2, ... y siempre se reemplaza la
+    que entró primero, el marco más antiguo es siempre el del puntero.
+    """
+
+    def __init__(self, marcos):
+        self.marcos = marcos
+        # frames[i] = página cargada en el marco i (-1 indica marco vacío)
+        self.frames = [-1] * marcos
+        # página -> marco donde está cargada (-1 si no lo está)
+        self.marco_de = Residencia()
+        # 'pointer' para saber qué marco reemplazar (ciclo FIFO)
+        self.pointer = 0
+
+    def acceder(self, pagina):
+        """
+        Procesa una referencia a 'pagina'.
+
+        Retorna (fallo, marco, victima):
+          - fallo: True si la página no estaba cargada
+          - marco: índice del marco donde queda la página
+          - victima: página reemplazada (-1 si no hubo reemplazo)
+        """
+        marco_de = self.marco_de
+        marco = marco_de[pagina]
+        if marco != -1:
+            return False, marco, -1
+
+        # Fallo: reemplazamos la página que entró primero
+        marco = self.pointer
+        victima = self.frames[marco]
+        if victima != -1:
+            marco_de[victima] = -1
+        self.frames[marco] = pagina
+        marco_de[pagina] = marco
+        # Avanzamos el pointer de forma circular
+        self.pointer = (marco + 1) % self.marcos
+        return True, marco, victima
+
+
+class MotorFIFODenso(MotorFIFO):
+    """
+    MotorFIFO para páginas compactadas a ids densos 0..num_paginas-1 (ver
+    traza.Traza): la residencia es un arreglo plano id -> marco (-1 = no
+    cargada) en lugar de un diccionario; acceder() es el mismo.
+    """
+
+    def __init__(self, marcos, num_paginas):
+        super().__init__(marcos)
+        self.marco_de = residencia_densa(num_paginas)
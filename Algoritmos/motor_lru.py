@@ -0,0 +1,122 @@
+# Algoritmos/motor_lru.py
+
+from array import array
+from collections import OrderedDict
+
+
+class MotorLRU:
+    """
+    Motor LRU con costo O(1) por referencia.
+
+    En lugar de recorrer los marcos en cada referencia (pagina in frames,
+    frames.index, min(usage)...), se mantiene un OrderedDict página -> marco
+    ordenado por recencia: la primera entrada es la menos recientemente usada
+    y la última la más reciente.
+      - Acierto: move_to_end(pagina)               -> O(1)
+      - Fallo con marco libre: se usa el siguiente libre (0, 1, 2, ...)
+      - Fallo sin marco libre: popitem(last=False)  -> O(1), devuelve la víctima
+        y el marco que ocupaba, que es donde entra la nueva página.
+    """
+
+    def __init__(self, marcos):
+        self.marcos = marcos
+        # frames[i] = página cargada en el marco i (-1 indica marco vacío)
+        self.frames = [-1] * marcos
+        # página -> marco, de la menos a la más recientemente usada
+        self.recencia = OrderedDict()
+
+    def acceder(self, pagina):
+        """
+        Procesa una referencia a 'pagina'.
+
+        Retorna (fallo, marco, victima):
+          - fallo: True si la página no estaba cargada
+          - marco: índice del marco donde queda la página
+          - victima: página reemplazada (-1 si no hubo reemplazo)
+        """
+        recencia = self.recencia
+        marco = recencia.get(pagina)
+        if marco is not None:
+            # Acierto: pasa a ser la más recientemente usada
+            recencia.move_to_end(pagina)
+            return False, marco, -1
+
+        if len(recencia) < self.marcos:
+            # Aún hay marcos libres: se llenan en orden
+            marco = len(recencia)
+            victima = -1
+        else:
+            # Reemplazamos la menos recientemente usada
+            victima, marco = recencia.popitem(last=False)
+
+        recencia[pagina] = marco
+        self.frames[marco] = pagina
+        return True, marco, victima
+
+
+class MotorLRUDenso:
+    """
+    Motor LRU para páginas compactadas a ids densos 0..num_paginas-1 (ver
+    traza.Traza), solo con arreglos planos:
+      - marco_de[id] = marco donde está cargada la página (-1 = no cargada)
+      - ant / sig: lista doblemente enlazada intrusiva sobre los marcos, de la
+        menos recientemente usada (cabeza) a la más reciente (cola)
+    Mismos resultados (fallo, marco, victima) que MotorLRU.
+    """
+
+    def __init__(self, marcos, num_paginas):
+        self.marcos = marcos
+        self.frames = array('i', [-1]) * marcos
+        self.marco_de = array('i', [-1]) * num_paginas
+        self.ant = array('i', [-1]) * marcos
+        self.sig = array('i', [-1]) * marcos
+        self.cabeza = -1
+        self.cola = -1
+        self.ocupados = 0
+
+    def acceder(self, pagina):
+        marco = self.marco_de[pagina]
+        if marco != -1:
+            # Acierto: el marco pasa al final de la lista (más reciente)
+            if marco != self.cola:
+                self._desenlazar(marco)
+                self._enlazar_al_final(marco)
+            return False, marco, -1
+
+        if self.ocupados < self.marcos:
+            # Aún hay marcos libres: se llenan en orden
+            marco = self.ocupados
+            self.ocupados += 1
+            victima = -1
+        else:
+            # Reemplazamos la menos recientemente usada (cabeza)
+            marco = self.cabeza
+            victima = self.frames[marco]
+            self.marco_de[victima] = -1
+            self._desenlazar(marco)
+
+        self._enlazar_al_final(marco)
+        self.frames[marco] = pagina
+        self.marco_de[pagina] = marco
+        return True, marco, victima
+
+    def _desenlazar(self, marco):
+        ant = self.ant[marco]
+        sig = self.sig[marco]
+        if ant == -1:
+            self.cabeza = sig
+        else:
+            self.sig[ant] = sig
+        if sig == -1:
+            self.cola = ant
+        else:
+            self.ant[sig] = ant
+
+    def _enlazar_al_final(self, marco):
+        self.ant[marco] = self.cola
+        self.sig[marco] = -1
+        if self.cola == -1:
+            self.cabeza = marco
+        else:
+            self.sig[self.cola] = marco
+        self.cola = marco
@@ -0,0 +1,128 @@
+# Algoritmos/motor_optimo.py
+
+import heapq
+from Algoritmos.residencia import Residencia, residencia_densa
+
+
+def siguiente_uso(referencia, num_paginas=None):
+    """
+    Calcula en una sola pasada hacia atrás el índice de la próxima aparición
+    de cada referencia. Con ids densos (ver traza.Traza) se puede pasar
+    num_paginas para usar un arreglo plano en lugar de un diccionario.
+
+    Retorna una lista 'siguiente' de len(referencia) elementos:
+      siguiente[i] = próximo j > i con referencia[j] == referencia[i],
+                     o len(referencia) si la página no vuelve a aparecer.
+    """
+    n = len(referencia)
+    siguiente = [n] * n
+    if num_paginas is not None:
+        ultima = [n] * num_paginas
+        for i in range(n - 1, -1, -1):
+            pagina = referencia[i]
+            siguiente[i] = ultima[pagina]
+            ultima[pagina] = i
+        return siguiente
+
+    ultima = {}  # página -> última posición vista (recorriendo hacia atrás)
+    for i in range(n - 1, -1, -1):
+        pagina = referencia[i]
+        siguiente[i] = ultima.get(pagina, n)
+        ultima[pagina] = i
+    return siguiente
+
+
+class MotorOptimo:
+    """
+    Motor del algoritmo Óptimo (Belady) en O(log marcos) por referencia.
+
+    Las páginas cargadas se guardan en un max-heap ordenado por su próximo uso
+    (se usa heapq con la clave negada). Las páginas que no vuelven a aparecer
+    tienen próximo uso = len(referencia), así que salen primero, y entre ellas
+    se desempata por insertion_time (FIFO), igual que Algoritmos.optimo.
+
+    Cuando una página cargada vuelve a usarse su clave cambia; en lugar de
+    buscarla dentro del heap se inserta una entrada nueva y la vieja se descarta
+    al salir (borrado perezoso). Si el heap acumula demasiadas entradas viejas
+    se reconstruye a partir de los marcos.
+    """
+
+    def __init__(self, marcos):
+        self.marcos = marcos
+        # frames[f] = página en el marco f (-1 indica marco vacío)
+        self.frames = [-1] * marcos
+        # página -> marco donde está cargada (-1 si no lo está)
+        self.marco_de = Residencia()
+        # próximo uso e instante de inserción de la página de cada marco
+        self.proximo = [0] * marcos
+        self.insertion_time = [-1] * marcos
+        # entradas (-próximo uso, insertion_time, marco)
+        self.heap = []
+        self.tiempo = 0
+        self.ocupados = 0
+
+    def acceder(self, pagina, proximo):
+        """
+        Procesa una referencia a 'pagina', cuyo próximo uso es 'proximo'
+        (ver siguiente_uso).
+
+        Retorna (fallo, marco, victima):
+          - fallo: True si la página no estaba cargada
+          - marco: índice del marco donde queda la página
+          - victima: página reemplazada (-1 si no hubo reemplazo)
+        """
+        t = self.tiempo
+        self.tiempo += 1
+
+        marco = self.marco_de[pagina]
+        if marco != -1:
+            # Acierto: solo cambia el próximo uso de la página
+            fallo = False
+            victima = -1
+        else:
+            fallo = True
+            if self.ocupados < self.marcos:
+                # Asignar al siguiente marco libre
+                marco = self.ocupados
+                self.ocupados += 1
+                victima = -1
+            else:
+                marco = self._elegir_victima()
+                victima = self.frames[marco]
+                self.marco_de[victima] = -1
+            self.frames[marco] = pagina
+            self.marco_de[pagina] = marco
+            self.insertion_time[marco] = t
+
+        self.proximo[marco] = proximo
+        heapq.heappush(self.heap, (-proximo, self.insertion_time[marco], marco))
+        if len(self.heap) > 2 * self.marcos + 32:
+            self._reconstruir_heap()
+        return fallo, marco, victima
+
+    def _elegir_victima(self):
+        # Saca entradas hasta encontrar una que siga vigente
+        heap = self.heap
+        while True:
+            menos_prox, insercion, marco = heapq.heappop(heap)
+            if -menos_prox == self.proximo[marco] and insercion == self.insertion_time[marco]:
+                return marco
+
+    def _reconstruir_heap(self):
+        self.heap = [
+            (-self.proximo[f], self.insertion_time[f], f)
+            for f in range(self.ocupados)
+        ]
+        heapq.heapify(self.heap)
+
+
+class MotorOptimoDenso(MotorOptimo):
+    """
+    MotorOptimo para páginas compactadas a ids densos 0..num_paginas-1 (ver
+    traza.Traza): la residencia es un arreglo plano id -> marco (-1 = no
+    cargada) en lugar de un diccionario; acceder() es el mismo.
+    """
+
+    def __init__(self, marcos, num_paginas):
+        super().__init__(marcos)
+        self.marco_de = residencia_densa(num_paginas)
@@ -0,0 +1,122 @@
+# Algoritmos/motor_segunda_oportunidad.py
+
+from array import array
+from collections import deque
+
+
+class MotorSegundaOportunidad:
+    """
+    Motor FIFO + segunda oportunidad (reloj) con costo O(1) amortizado.
+
+    Los marcos se guardan en arreglos compactos (array('q') con la página y
+    bytearray con el bit de referencia de cada marco) más un diccionario
+    página -> marco, en lugar de un dict por marco y de reconstruir la lista
+    de páginas en cada referencia.
+
+    Dos modos:
+      - limpiar_bits=False (reloj clásico): un acierto pone el bit del marco
+        en 1. En un fallo la manecilla avanza circularmente limpiando los bits
+        en 1 y reemplaza el primer marco con bit en 0.
+      - limpiar_bits=True (compatible con Algoritmos.fifo_mejorado): un acierto
+        limpia todos los bits y marca solo el marco tocado, así que hay a lo
+        sumo un bit en 1 y basta con recordar cuál es. La víctima es la más
+        antigua por insertion_time; si tiene el bit en 1 se limpia pero
+        conserva su lugar, y se reemplaza la siguiente más antigua. El orden de
+        inserción se lleva en una deque de marcos.
+
+    Tras cada acceso, 'limpiados' contiene los marcos cuyo bit pasó de 1 a 0.
+    """
+
+    def __init__(self, marcos, limpiar_bits=False):
+        self.marcos = marcos
+        self.limpiar_bits = limpiar_bits
+        # paginas[f] = página del marco f (-1 indica marco vacío); bits[f] = 0/1
+        self.paginas = array('q', [-1]) * marcos
+        self.bits = bytearray(marcos)
+        # página -> marco donde está cargada
+        self.marco_de = {}
+        # manecilla del reloj (también indica el siguiente marco libre)
+        self.manecilla = 0
+        # modo compatible: orden de inserción y único marco con bit en 1
+        self.orden = deque()
+        self.marcado = -1
+        self.limpiados = []
+
+    def acceder(self, pagina):
+        """
+        Procesa una referencia a 'pagina'.
+
+        Retorna (fallo, marco, victima):
+          - fallo: True si la página no estaba cargada
+          - marco: índice del marco donde queda la página (-1 si no se cargó,
+            lo que solo ocurre en el modo compatible con un único marco)
+          - victima: página reemplazada (-1 si no hubo reemplazo)
+        """
+        limpiados = self.limpiados
+        limpiados.clear()
+        bits = self.bits
+
+        marco = self.marco_de.get(pagina)
+        if marco is not None:
+            # Acierto: segunda vida para el marco tocado
+            if self.limpiar_bits:
+                marcado = self.marcado
+                if marcado != -1 and marcado != marco:
+                    bits[marcado] = 0
+                    limpiados.append(marcado)
+                self.marcado = marco
+            bits[marco] = 1
+            return False, marco, -1
+
+        if len(self.marco_de) < self.marcos:
+            # Marco libre: se llenan en orden
+            marco = len(self.marco_de)
+            victima = -1
+            self.manecilla = (marco + 1) % self.marcos
+            if self.limpiar_bits:
+                self.orden.append(marco)
+        elif self.limpiar_bits:
+            marco = self._victima_por_insercion()
+            if marco == -1:
+                return True, -1, -1
+            victima = self.paginas[marco]
+        else:
+            marco = self._victima_por_manecilla()
+            victima = self.paginas[marco]
+
+        if victima != -1:
+            del self.marco_de[victima]
+        self.paginas[marco] = pagina
+        bits[marco] = 0
+        self.marco_de[pagina] = marco
+        return True, marco, victima
+
+    def _victima_por_manecilla(self):
+        bits = self.bits
+        marcos = self.marcos
+        mano = self.manecilla
+        while bits[mano]:
+            bits[mano] = 0
+            self.limpiados.append(mano)
+            mano = (mano + 1) % marcos
+        self.manecilla = (mano + 1) % marcos
+        return mano
+
+    def _victima_por_insercion(self):
+        orden = self.orden
+        primero = orden.popleft()
+        if not self.bits[primero]:
+            orden.append(primero)
+            return primero
+        # La más antigua tiene bit: se limpia y sigue siendo la más antigua
+        self.bits[primero] = 0
+        self.marcado = -1
+        self.limpiados.append(primero)
+        if not orden:
+            # Con un solo marco no queda a quién reemplazar
+            orden.append(primero)
+            return -1
+        victima = orden.popleft()
+        orden.appendleft(primero)
+        orden.append(victima)
+        return victima
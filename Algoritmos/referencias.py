@@ -0,0 +1,102 @@
+# Algoritmos/referencias.py
+
+import re
+
+# Separadores aceptados entre páginas: espacios, tabuladores, saltos de línea, ',' y ';'
+SEPARADORES = b' \t\r\n,;'
+# Más dígitos que esto no cabe con seguridad en un int64
+MAX_DIGITOS = 18
+# Tokens = tramos sin separadores; solo los de SEPARADORES (no todo el \s de
+# Unicode, que incluye p. ej. el espacio no separable)
+_TOKEN = re.compile(f"[^{re.escape(SEPARADORES.decode())}]+")
+
+
+class ReferenciasInvalidas(ValueError):
+    """
+    Cadena de referencia con tokens mal formados. 'errores' es la lista de
+    (posicion, token), con la posición del primer carácter (desde 0).
+    """
+
+    def __init__(self, errores):
+        self.errores = errores
+        detalle = ", ".join(f"'{token}' en la posición {pos}" for pos, token in errores[:5])
+        if len(errores) > 5:
+            detalle += f" y {len(errores) - 5} más"
+        super().__init__(f"Páginas inválidas: {detalle}")
+
+
+def _errores(texto):
+    # Solo se usa cuando algo falló: ubica los tokens malos en el texto original
+    errores = []
+    for m in _TOKEN.finditer(texto):
+        token = m.group()
+        if not (token.isascii() and token.isdigit()) or len(token) > MAX_DIGITOS:
+            errores.append((m.start(), token))
+    return errores
+
+
+def leer_referencias(texto):
+    """
+    Convierte una cadena de referencia en un arreglo int64 de NumPy, en una
+    sola pasada vectorizada sobre los bytes (sin listas por carácter).
+
+      - Solo dígitos y sin separadores ("70120304"): cada dígito es una
+        página, como hacía la ventana principal originalmente.
+      - Con separadores ("7, 0, 12\\n30 4"): cada número, de cualquier
+        cantidad de dígitos, es una página.
+
+    Lanza ReferenciasInvalidas con las posiciones de los tokens mal formados.
+    """
+    import numpy as np
+
+    texto = texto.strip()
+    datos = texto.encode()
+    digitos = np.frombuffer(datos, dtype=np.uint8) - ord('0')
+    if (digitos < 10).all():          # uint8: lo menor que '0' da la vuelta
+        # Formato original: una página por carácter
+        return digitos.astype(np.int64)
+    try:
+        return leer_numeros(datos)
+    except ReferenciasInvalidas:
+        # Posiciones en caracteres del texto, no en bytes
+        raise ReferenciasInvalidas(_errores(texto)) from None
+
+
+def leer_numeros(datos):
+    """
+    Números separados (espacios, saltos de línea, ',' o ';') de un bloque de
+    bytes ASCII -> arreglo int64. Es la parte vectorizada de leer_referencias,
+    sin el caso "un dígito por página"; los lectores de archivos la aplican
+    trozo a trozo. Las posiciones de ReferenciasInvalidas son en bytes.
+    """
+    import numpy as np
+
+    datos = np.frombuffer(datos, dtype=np.uint8)
+    digitos = datos - ord('0')
+    es_digito = digitos < 10
+
+    # Tabla de 256 entradas: clasificar cada byte es una sola indexación
+    separador = np.zeros(256, dtype=bool)
+    separador[np.frombuffer(SEPARADORES, dtype=np.uint8)] = True
+    es_separador = separador[datos]
+    if not (es_digito | es_separador).all():
+        raise ReferenciasInvalidas(_errores(datos.tobytes().decode('latin-1')))
+
+    # Tokens = tramos de dígitos; empiezan donde el carácter anterior no lo era
+    inicio = np.flatnonzero(es_digito & ~np.concatenate(([False], es_digito[:-1])))
+    fin = np.flatnonzero(es_digito & ~np.concatenate((es_digito[1:], [False]))) + 1
+    largo = fin - inicio
+    if largo.max(initial=0) > MAX_DIGITOS:
+        raise ReferenciasInvalidas(_errores(datos.tobytes().decode('latin-1')))
+
+    # Se recorre por columnas de dígitos (a lo sumo MAX_DIGITOS pasadas), no
+    # por token: en la pasada k se agrega el k-ésimo dígito de los tokens que
+    # lo tienen
+    paginas = np.zeros(len(inicio), dtype=np.int64)
+    activos = np.arange(len(inicio))
+    k = 0
+    while len(activos):
+        paginas[activos] = paginas[activos] * 10 + digitos[inicio[activos] + k]
+        k += 1
+        activos = activos[largo[activos] > k]
+    return paginas
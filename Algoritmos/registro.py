@@ -0,0 +1,95 @@
+# Algoritmos/registro.py
+
+from importlib import import_module
+
+
+def _cargar(ruta):
+    """
+    Importa "modulo:atributo". Si el atributo es "Clase.metodo", se resuelve
+    sobre una instancia nueva de Clase (p. ej. "Algoritmos.algoritmos:Algoritmos.fifo").
+    """
+    modulo, atributo = ruta.split(':')
+    objeto = import_module(modulo)
+    partes = atributo.split('.')
+    objeto = getattr(objeto, partes[0])
+    if len(partes) > 1:
+        objeto = getattr(objeto(), partes[1])
+    return objeto
+
+
+class Politica:
+    """
+    Entrada del registro de algoritmos. Guarda solo rutas "modulo:atributo";
+    el módulo de cada motor se importa la primera vez que se usa, así los
+    motores pesados (con NumPy, por ejemplo) no retrasan el inicio.
+
+    Capacidades:
+      - 'estadisticas': simular(..., solo_estadisticas=True)
+      - 'flujo': flujo(paginas, marcos), generador sobre cualquier iterable
+      - 'curva': curva(referencia, max_marcos), fallos para todos los marcos
+    """
+
+    def __init__(self, nombre, simulador, flujo=None, curva=None, estadisticas=True):
+        self.nombre = nombre
+        self.rutas = {'simulador': simulador, 'flujo': flujo, 'curva': curva}
+        self.estadisticas = estadisticas
+        self._cargados = {}
+
+    @property
+    def capacidades(self):
+        capacidades = {c for c in ('flujo', 'curva') if self.rutas[c]}
+        if self.estadisticas:
+            capacidades.add('estadisticas')
+        return capacidades
+
+    def _funcion(self, tipo):
+        if tipo not in self._cargados:
+            if not self.rutas[tipo]:
+                raise ValueError(f"{self.nombre} no tiene la capacidad '{tipo}'")
+            self._cargados[tipo] = _cargar(self.rutas[tipo])
+        return self._cargados[tipo]
+
+    def simular(self, referencia, marcos, **opciones):
+        """Misma firma y retorno que los métodos de Algoritmos."""
+        return self._funcion('simulador')(referencia, marcos, **opciones)
+
+    def flujo(self, paginas, marcos):
+        return self._funcion('flujo')(paginas, marcos)
+
+    def curva(self, referencia, max_marcos):
+        return self._funcion('curva')(referencia, max_marcos)
+
+
+# nombre -> Politica, en orden de registro (es el orden del combo de la GUI)
+_REGISTRO = {}
+
+
+def registrar(nombre, simulador, flujo=None, curva=None, estadisticas=True):
+    _REGISTRO[nombre] = Politica(nombre, simulador, flujo, curva, estadisticas)
+
+
+def nombres(capacidad=None):
+    """Nombres registrados (opcionalmente solo los que tienen una capacidad)."""
+    return [n for n, p in _REGISTRO.items() if capacidad is None or capacidad in p.capacidades]
+
+
+def obtener(nombre):
+    try:
+        return _REGISTRO[nombre]
+    except KeyError:
+        raise ValueError("Algoritmo no reconocido") from None
+
+
+registrar("FIFO",
+          simulador="Algoritmos.algoritmos:Algoritmos.fifo",
+          flujo="Algoritmos.flujo:fifo_flujo")
+registrar("LRU",
+          simulador="Algoritmos.algoritmos:Algoritmos.lru",
+          flujo="Algoritmos.flujo:lru_flujo",
+          curva="Algoritmos.curvas:lru_curve")
+registrar("OPTIMO",
+          simulador="Algoritmos.algoritmos:Algoritmos.optimo",
+          curva="Algoritmos.curvas:optimo_curve")
+registrar("FIFO MEJORADO",
+          simulador="Algoritmos.algoritmos:Algoritmos.fifo_mejorado",
+          flujo="Algoritmos.flujo:fifo_mejorado_flujo")
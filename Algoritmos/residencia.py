@@ -0,0 +1,21 @@
+# Algoritmos/residencia.py
+
+from array import array
+
+
+class Residencia(dict):
+    """
+    Residencia página -> marco de los motores para páginas arbitrarias.
+    Una página no cargada da -1, igual que en residencia_densa: así el mismo
+    acceder() sirve para diccionarios y arreglos planos. Al reemplazar una
+    página se le asigna -1 (la entrada queda, a lo sumo una por página
+    distinta, como en el arreglo denso).
+    """
+
+    def __missing__(self, pagina):
+        return -1
+
+
+def residencia_densa(num_paginas):
+    """Residencia id -> marco para ids densos 0..num_paginas-1 (ver traza.Traza)."""
+    return array('i', [-1]) * num_paginas
@@ -0,0 +1,138 @@
+# Algoritmos/resultado.py
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class ResultadoEventos:
+    """
+    Resultado compacto de una simulación: en lugar de la matriz densa
+    (marcos x len(referencia), donde cada columna repite la anterior salvo a
+    lo sumo una celda) se guardan solo los eventos que cambian un marco:
+
+        (tiempo, marco, entra, sale, bit)
+
+    en arreglos de 'array'/'bytearray', más los instantes de los fallos.
+    El tamaño es O(fallos) y no O(n * marcos).
+
+    Cualquier columna se reconstruye a pedido: cada 'intervalo' eventos se
+    guarda una copia del estado de los marcos y desde ella se reaplican los
+    eventos hasta el instante pedido.
+    """
+
+    def __init__(self, marcos, n, con_bits=False):
+        """
+        marcos   -- número de marcos
+        n        -- largo de la referencia (número de columnas)
+        con_bits -- si True, el resultado lleva bit de referencia por marco
+                    (FIFO + segunda oportunidad); se consulta aparte de las
+                    páginas con columna_bits / matriz_bits
+        """
+        self.marcos = marcos
+        self.n = n
+        self.con_bits = con_bits
+
+        # Eventos (una posición por evento en cada arreglo)
+        self.tiempo = array('q')
+        self.marco = array('i')
+        self.entra = array('q')
+        self.sale = array('q')
+        self.bit = bytearray()
+
+        # Instantes con fallo de página, en orden
+        self.tiempos_fallo = array('q')
+
+        # Copias del estado: _puntos[k] = estado antes del evento k * intervalo
+        self.intervalo = max(64, marcos)
+        self._puntos = []
+        # Estado actual (tras el último evento); -1 indica marco vacío
+        self._paginas = array('q', [-1]) * marcos
+        self._bits = bytearray(marcos)
+
+    @property
+    def total_fallos(self):
+        return len(self.tiempos_fallo)
+
+    def marcar_fallo(self, t):
+        self.tiempos_fallo.append(t)
+
+    def registrar(self, t, marco, entra, sale, bit=0):
+        """
+        Registra que en el instante t el marco pasa a tener la página 'entra'
+        (antes 'sale') con el bit dado. Si el marco no cambia, no se guarda nada.
+        """
+        if self._paginas[marco] == entra and self._bits[marco] == bit:
+            return
+        if len(self.tiempo) % self.intervalo == 0:
+            self._puntos.append((array('q', self._paginas), bytearray(self._bits)))
+        self.tiempo.append(t)
+        self.marco.append(marco)
+        self.entra.append(entra)
+        self.sale.append(sale)
+        self.bit.append(bit)
+        self._paginas[marco] = entra
+        self._bits[marco] = bit
+
+    def es_fallo(self, t):
+        i = bisect_left(self.tiempos_fallo, t)
+        return i < len(self.tiempos_fallo) and self.tiempos_fallo[i] == t
+
+    def columna(self, t):
+        """Páginas de los marcos luego de la referencia t ('' = marco vacío)."""
+        paginas, _ = self._estado(t)
+        return ['' if p == -1 else p for p in paginas]
+
+    def columna_bits(self, t):
+        """Bits de referencia de los marcos luego de la referencia t."""
+        _, bits = self._estado(t)
+        return [bool(b) for b in bits]
+
+    def matriz(self):
+        """Matriz densa de páginas (marcos filas x n columnas), como la de Algoritmos."""
+        filas = [[''] * self.n for _ in range(self.marcos)]
+        celdas = [[''] if p == -1 else [p] for p in self.entra]
+        return self._rellenar(filas, celdas, [''])
+
+    def matriz_bits(self):
+        """Bits de referencia (marcos filas de bytearray x n columnas, 0/1)."""
+        filas = [bytearray(self.n) for _ in range(self.marcos)]
+        celdas = [b'\x01' if b else b'\x00' for b in self.bit]
+        return self._rellenar(filas, celdas, b'\x00')
+
+    def fallos_col(self):
+        """Lista con '*' o '' por columna, como la de Algoritmos."""
+        fallos_col = [''] * self.n
+        for t in self.tiempos_fallo:
+            fallos_col[t] = '*'
+        return fallos_col
+
+    def _estado(self, t):
+        # Eventos con tiempo <= t
+        k = bisect_right(self.tiempo, t)
+        if not self._puntos:
+            return self._paginas, self._bits
+        p = min(k // self.intervalo, len(self._puntos) - 1)
+        paginas, bits = self._puntos[p]
+        paginas = array('q', paginas)
+        bits = bytearray(bits)
+        for e in range(p * self.intervalo, k):
+            paginas[self.marco[e]] = self.entra[e]
+            bits[self.marco[e]] = self.bit[e]
+        return paginas, bits
+
+    def _rellenar(self, filas, celdas, vacio):
+        # celdas[e] = contenido (secuencia de largo 1) del marco desde el evento e
+        n = self.n
+        desde = [0] * self.marcos
+        valor = [vacio] * self.marcos
+        for e in range(len(self.tiempo)):
+            f = self.marco[e]
+            t = self.tiempo[e]
+            if t > desde[f]:
+                # Asignación por rebanada: se rellena el tramo completo de una vez
+                filas[f][desde[f]:t] = valor[f] * (t - desde[f])
+            desde[f] = t
+            valor[f] = celdas[e]
+        for f in range(self.marcos):
+            filas[f][desde[f]:n] = valor[f] * (n - desde[f])
+        return filas
@@ -0,0 +1,153 @@
+# Algoritmos/simuladores.py
+
+from abc import ABC, abstractmethod
+from array import array
+from collections import deque, OrderedDict
+from Algoritmos.motor_fifo import MotorFIFO
+from Algoritmos.motor_lru import MotorLRU
+from Algoritmos.motor_segunda_oportunidad import MotorSegundaOportunidad
+from Algoritmos.residencia import Residencia
+
+
+class Simulador(ABC):
+    """
+    Simulador incremental: conserva el estado de los marcos entre llamadas,
+    así que agregar referencias cuesta O(referencias nuevas) en lugar de
+    volver a simular toda la cadena.
+
+      - append(pagina) / extend(paginas): procesan referencias nuevas
+      - snapshot(): estado completo como dict (serializable con json)
+      - restore(datos): vuelve al estado de un snapshot, p. ej. para retomar
+        un barrido largo desde su último punto de control
+
+    Óptimo no tiene simulador incremental: la víctima depende de referencias
+    futuras, así que una referencia nueva puede cambiar decisiones ya
+    tomadas y no hay forma de procesarla en O(1). Para Óptimo se usa
+    Algoritmos.optimo sobre la traza completa.
+    """
+
+    algoritmo = None
+
+    def __init__(self, marcos):
+        self.marcos = marcos
+        self.referencias = 0
+        self.aciertos = 0
+        self.total_fallos = 0
+        self.reemplazos = 0
+        self.motor = self._crear_motor()
+
+    @abstractmethod
+    def _crear_motor(self):
+        """Motor nuevo (marcos vacíos) para self.marcos."""
+
+    def append(self, pagina):
+        """Procesa una referencia. Retorna (fallo, marco, victima) del motor."""
+        fallo, marco, victima = self.motor.acceder(pagina)
+        self.referencias += 1
+        if fallo:
+            self.total_fallos += 1
+            if victima != -1:
+                self.reemplazos += 1
+        else:
+            self.aciertos += 1
+        return fallo, marco, victima
+
+    def extend(self, paginas):
+        for pagina in paginas:
+            self.append(pagina)
+
+    def snapshot(self):
+        return {
+            'algoritmo': self.algoritmo,
+            'marcos': self.marcos,
+            'referencias': self.referencias,
+            'aciertos': self.aciertos,
+            'total_fallos': self.total_fallos,
+            'reemplazos': self.reemplazos,
+            'estado': self._estado_motor(),
+        }
+
+    def restore(self, datos):
+        if datos['algoritmo'] != self.algoritmo or datos['marcos'] != self.marcos:
+            raise ValueError("El snapshot no corresponde a este simulador")
+        self.referencias = datos['referencias']
+        self.aciertos = datos['aciertos']
+        self.total_fallos = datos['total_fallos']
+        self.reemplazos = datos['reemplazos']
+        self.motor = self._crear_motor()
+        self._restaurar_motor(datos['estado'])
+
+    @abstractmethod
+    def _estado_motor(self):
+        """Estado del motor como dict serializable con json."""
+
+    @abstractmethod
+    def _restaurar_motor(self, estado):
+        """Carga en self.motor (recién creado) el estado de _estado_motor."""
+
+
+class SimuladorFIFO(Simulador):
+    algoritmo = "FIFO"
+
+    def _crear_motor(self):
+        return MotorFIFO(self.marcos)
+
+    def _estado_motor(self):
+        return {'frames': list(self.motor.frames), 'pointer': self.motor.pointer}
+
+    def _restaurar_motor(self, estado):
+        motor = self.motor
+        motor.frames = list(estado['frames'])
+        motor.pointer = estado['pointer']
+        motor.marco_de = Residencia((p, f) for f, p in enumerate(motor.frames) if p != -1)
+
+
+class SimuladorLRU(Simulador):
+    algoritmo = "LRU"
+
+    def _crear_motor(self):
+        return MotorLRU(self.marcos)
+
+    def _estado_motor(self):
+        # Pares [página, marco] de la menos a la más recientemente usada
+        return {'recencia': [[p, f] for p, f in self.motor.recencia.items()]}
+
+    def _restaurar_motor(self, estado):
+        motor = self.motor
+        motor.recencia = OrderedDict((p, f) for p, f in estado['recencia'])
+        for p, f in motor.recencia.items():
+            motor.frames[f] = p
+
+
+class SimuladorFIFOMejorado(Simulador):
+    algoritmo = "FIFO MEJORADO"
+
+    def __init__(self, marcos, limpiar_bits=True):
+        # Por defecto con la semántica de Algoritmos.fifo_mejorado
+        self.limpiar_bits = limpiar_bits
+        super().__init__(marcos)
+
+    def _crear_motor(self):
+        return MotorSegundaOportunidad(self.marcos, self.limpiar_bits)
+
+    def _estado_motor(self):
+        motor = self.motor
+        return {
+            'paginas': list(motor.paginas),
+            'bits': list(motor.bits),
+            'manecilla': motor.manecilla,
+            'orden': list(motor.orden),
+            'marcado': motor.marcado,
+            'limpiar_bits': motor.limpiar_bits,
+        }
+
+    def _restaurar_motor(self, estado):
+        if estado['limpiar_bits'] != self.limpiar_bits:
+            raise ValueError("El snapshot no corresponde a este simulador")
+        motor = self.motor
+        motor.paginas = array('q', estado['paginas'])
+        motor.bits = bytearray(estado['bits'])
+        motor.manecilla = estado['manecilla']
+        motor.orden = deque(estado['orden'])
+        motor.marcado = estado['marcado']
+        motor.marco_de = {p: f for f, p in enumerate(motor.paginas) if p != -1}
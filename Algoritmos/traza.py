@@ -0,0 +1,71 @@
+# Algoritmos/traza.py
+
+from functools import cached_property
+from itertools import chain
+
+# Elementos por bloque al pasar un arreglo de NumPy a ints de Python
+BLOQUE = 1 << 16
+
+
+def en_bloques(arreglo):
+    """
+    Recorre un arreglo de NumPy como ints de Python, convirtiendo BLOQUE
+    elementos a la vez: los motores reciben ints (lo más rápido para
+    indexar listas y diccionarios) sin crear nunca una lista del tamaño de
+    la traza.
+    """
+    return chain.from_iterable(arreglo[i:i + BLOQUE].tolist()
+                               for i in range(0, len(arreglo), BLOQUE))
+
+
+class Traza:
+    """
+    Referencia con las páginas renumeradas a ids densos 0..K-1.
+
+    Las trazas reales usan números de página dispersos (hasta 64 bits); con
+    ids densos los motores pueden llevar la residencia en arreglos planos
+    indexados por id (MotorFIFODenso, MotorLRUDenso, MotorOptimoDenso) en
+    lugar de diccionarios por página.
+
+      - ids: arreglo de NumPy con el id de cada referencia
+      - valores: arreglo de NumPy id -> página original (para mostrar)
+      - indice: TraceIndex (próximo/anterior uso, ...) calculado la primera
+        vez que se pide y guardado en la traza
+    """
+
+    def __init__(self, ids, valores):
+        self.ids = ids
+        self.valores = valores
+
+    @classmethod
+    def desde(cls, referencia):
+        """
+        Compacta una referencia (lista o arreglo de páginas) en una sola
+        pasada. Un arreglo de enteros (p. ej. un memmap uint32) se usa con su
+        tipo, sin copiarlo antes a int64.
+        """
+        import numpy as np
+
+        paginas = np.asarray(referencia)
+        if paginas.dtype.kind not in "iu":
+            paginas = paginas.astype(np.int64)
+        # valores ordenados y, para cada referencia, su posición en valores
+        valores, ids = np.unique(paginas, return_inverse=True)
+        return cls(ids.astype(np.int32).ravel(), valores)
+
+    @cached_property
+    def indice(self):
+        from Algoritmos.indice_traza import TraceIndex
+
+        return TraceIndex(self.ids, self.num_paginas)
+
+    @property
+    def num_paginas(self):
+        return len(self.valores)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, t):
+        # Página original de la referencia t
+        return int(self.valores[self.ids[t]])
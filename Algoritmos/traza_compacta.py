@@ -0,0 +1,244 @@
+# Algoritmos/traza_compacta.py
+
+import struct
+from itertools import chain, islice
+
+# Formato .trz (todo little-endian):
+#
+#   cabecera  "TRZ1", referencias por bloque (u32), total de referencias (u64),
+#             páginas distintas (u64), número de bloques (u64),
+#             posición del índice (u64)
+#   bloques   diferencias entre páginas consecutivas en zigzag + varint; la
+#             primera de cada bloque es respecto de 0, así cada bloque se
+#             decodifica solo
+#   índice    número de bloques + 1 posiciones (u64): el bloque i ocupa
+#             [indice[i], indice[i + 1])
+#
+# Las trazas reales tienen mucha localidad: la mayoría de las diferencias
+# caben en 1 o 2 bytes en lugar de los 8 de un uint64 o los ~10 de un texto.
+MAGIA = b"TRZ1"
+_CABECERA = struct.Struct("<4sIQQQQ")
+TAMANO_BLOQUE = 1 << 16
+
+
+def _codificar(paginas):
+    # paginas: arreglo int64 -> bytes varint de las diferencias en zigzag
+    import numpy as np
+
+    diferencias = np.diff(paginas, prepend=np.int64(0))
+    zigzag = ((diferencias << 1) ^ (diferencias >> 63)).view(np.uint64)
+
+    # Bytes por valor: 7 bits útiles por byte (a lo sumo 10 para 64 bits)
+    largos = np.ones(len(zigzag), dtype=np.int64)
+    resto = zigzag >> np.uint64(7)
+    while resto.any():
+        largos += resto > 0
+        resto >>= np.uint64(7)
+
+    inicio = np.cumsum(largos) - largos
+    salida = np.zeros(int(largos.sum()), dtype=np.uint8)
+    activos = np.arange(len(zigzag))
+    k = 0
+    while len(activos):
+        grupo = (zigzag[activos] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        # Bit alto en 1 = siguen más bytes del mismo valor
+        sigue = (largos[activos] > k + 1).astype(np.uint64) << np.uint64(7)
+        salida[inicio[activos] + k] = grupo | sigue
+        k += 1
+        activos = activos[largos[activos] > k]
+    return salida.tobytes()
+
+
+def _decodificar(datos):
+    # datos: arreglo uint8 de un bloque -> arreglo int64 de páginas
+    import numpy as np
+
+    if len(datos) == 0:
+        return np.zeros(0, dtype=np.int64)
+    fin = np.flatnonzero(datos < 0x80)
+    inicio = np.concatenate(([0], fin[:-1] + 1))
+    # Posición de cada byte dentro de su valor
+    k = np.arange(len(datos)) - np.repeat(inicio, fin - inicio + 1)
+    partes = (datos & 0x7F).astype(np.uint64) << (7 * k).astype(np.uint64)
+    zigzag = np.bitwise_or.reduceat(partes, inicio)
+    diferencias = (zigzag >> np.uint64(1)).view(np.int64) ^ -(zigzag & np.uint64(1)).view(np.int64)
+    return np.cumsum(diferencias)
+
+
+def _distintos(paginas):
+    # Valores distintos ordenados (ordenar es más rápido que np.unique con hash)
+    import numpy as np
+
+    paginas = np.sort(paginas)
+    nueva = np.ones(len(paginas), dtype=bool)
+    nueva[1:] = paginas[1:] != paginas[:-1]
+    return paginas[nueva]
+
+
+def _reagrupar(arreglos, tamano_bloque):
+    # Flujo de arreglos de cualquier largo -> bloques de exactamente
+    # tamano_bloque páginas (salvo el último), como espera el índice
+    import numpy as np
+
+    partes = []
+    acumulado = 0
+    for arreglo in arreglos:
+        partes.append(arreglo)
+        acumulado += len(arreglo)
+        if acumulado >= tamano_bloque:
+            datos = np.concatenate(partes)
+            completos = len(datos) - len(datos) % tamano_bloque
+            for inicio in range(0, completos, tamano_bloque):
+                yield datos[inicio:inicio + tamano_bloque].astype(np.int64)
+            partes = [datos[completos:]]
+            acumulado = len(partes[0])
+    if acumulado:
+        yield np.concatenate(partes).astype(np.int64)
+
+
+def _bloques(paginas, tamano_bloque):
+    import numpy as np
+
+    if isinstance(paginas, np.ndarray):
+        # Arreglos y memmaps se cortan sin recorrerlos elemento a elemento
+        for inicio in range(0, len(paginas), tamano_bloque):
+            yield paginas[inicio:inicio + tamano_bloque].astype(np.int64)
+        return
+    paginas = iter(paginas)
+    primero = next(paginas, None)
+    if primero is None:
+        return
+    paginas = chain([primero], paginas)
+    if isinstance(primero, np.ndarray):
+        # Flujo de arreglos (lector_trazas.bloques, bloques_direcciones)
+        yield from _reagrupar(paginas, tamano_bloque)
+        return
+    while True:
+        bloque = np.fromiter(islice(paginas, tamano_bloque), dtype=np.int64)
+        if len(bloque) == 0:
+            return
+        yield bloque
+
+
+def escribir_compacta(ruta, paginas, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Escribe una traza .trz a partir de cualquier iterable de páginas
+    (generador, lista, arreglo o memmap) o de un iterable de arreglos de
+    páginas (como lector_trazas.bloques); se consume por bloques, sin
+    cargarlo entero. Retorna el número de referencias escritas.
+    """
+    import numpy as np
+
+    indice = []
+    total = 0
+    # Páginas distintas: uniones parciales, compactadas cuando crecen
+    vistas = np.zeros(0, dtype=np.int64)
+    pendientes = []
+    with open(ruta, 'wb') as archivo:
+        archivo.write(bytes(_CABECERA.size))
+        for bloque in _bloques(paginas, tamano_bloque):
+            indice.append(archivo.tell())
+            archivo.write(_codificar(bloque))
+            total += len(bloque)
+            pendientes.append(_distintos(bloque))
+            if sum(map(len, pendientes)) > max(len(vistas), tamano_bloque):
+                vistas = _distintos(np.concatenate([vistas, *pendientes]))
+                pendientes = []
+        distintas = len(_distintos(np.concatenate([vistas, *pendientes])))
+
+        indice.append(archivo.tell())
+        posicion_indice = archivo.tell()
+        archivo.write(np.asarray(indice, dtype='<u8').tobytes())
+        archivo.seek(0)
+        archivo.write(_CABECERA.pack(MAGIA, tamano_bloque, total, distintas,
+                                     len(indice) - 1, posicion_indice))
+    return total
+
+
+def convertir_a_compacta(ruta_origen, ruta_destino, formato=None, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Convierte una traza de texto (o cualquier formato de lector_trazas,
+    comprimido o no) a .trz.
+    """
+    from Algoritmos.lector_trazas import bloques, compresion_de, formato_de, leer_binario
+
+    formato = formato or formato_de(ruta_origen)
+    if formato in ("uint32", "uint64") and compresion_de(ruta_origen) is None:
+        origen = leer_binario(ruta_origen, formato)
+    else:
+        origen = bloques(ruta_origen, formato)
+    return escribir_compacta(ruta_destino, origen, tamano_bloque)
+
+
+class TrazaCompacta:
+    """
+    Lector de trazas .trz sobre un np.memmap del archivo. Con el índice de
+    bloques, leer desde cualquier posición decodifica solo los bloques que
+    la cubren, no el prefijo de la traza.
+
+      - len(traza), traza.distintas
+      - traza.leer(inicio, cantidad) -> arreglo int64
+      - traza.bloques() -> arreglos int64 bloque a bloque
+      - iter(traza) -> páginas (int de Python) una a una
+    """
+
+    def __init__(self, ruta):
+        import numpy as np
+
+        with open(ruta, 'rb') as archivo:
+            cabecera = archivo.read(_CABECERA.size)
+        if len(cabecera) < _CABECERA.size or cabecera[:4] != MAGIA:
+            raise ValueError(f"{ruta}: no es una traza compacta (.trz)")
+        (_, self.tamano_bloque, self.total, self.distintas,
+         num_bloques, posicion_indice) = _CABECERA.unpack(cabecera)
+        self.datos = np.memmap(ruta, dtype=np.uint8, mode='r')
+        self.indice = self.datos[posicion_indice:posicion_indice + 8 * (num_bloques + 1)].view('<u8')
+
+    def __len__(self):
+        return self.total
+
+    @property
+    def num_bloques(self):
+        return len(self.indice) - 1
+
+    def bloque(self, i):
+        return _decodificar(self.datos[self.indice[i]:self.indice[i + 1]])
+
+    def bloques(self):
+        for i in range(self.num_bloques):
+            yield self.bloque(i)
+
+    def leer(self, inicio, cantidad):
+        import numpy as np
+
+        fin = min(inicio + cantidad, self.total)
+        if inicio >= fin:
+            return np.zeros(0, dtype=np.int64)
+        primero = inicio // self.tamano_bloque
+        ultimo = (fin - 1) // self.tamano_bloque
+        partes = np.concatenate([self.bloque(i) for i in range(primero, ultimo + 1)])
+        desde = inicio - primero * self.tamano_bloque
+        return partes[desde:desde + (fin - inicio)]
+
+    def __getitem__(self, t):
+        if not 0 <= t < self.total:
+            raise IndexError(t)
+        return int(self.leer(t, 1)[0])
+
+    def __iter__(self):
+        for bloque in self.bloques():
+            yield from bloque.tolist()
+
+
+# ------------------ EJEMPLO DE USO ------------------
+# python -m Algoritmos.traza_compacta traza.txt traza.trz
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 3:
+        sys.exit("Uso: python -m Algoritmos.traza_compacta ORIGEN DESTINO.trz")
+    total = convertir_a_compacta(sys.argv[1], sys.argv[2])
+    traza = TrazaCompacta(sys.argv[2])
+    print("Referencias:", total)
+    print("Páginas distintas:", traza.distintas)
+    print("Bloques:", traza.num_bloques)
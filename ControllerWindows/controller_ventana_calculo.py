@@ -1,10 +1,29 @@
 # ControllerWindows/controller_ventana_calculo.py
 
-from PyQt5 import QtCore
-from PyQt5.QtWidgets import QMainWindow, QMessageBox, QTableWidgetItem
+from PyQt5.QtCore import QThreadPool
+from PyQt5.QtWidgets import QMainWindow, QMessageBox
 from DesignWindows.ventana_calculo import Ui_MainWindow as Ui_VentanaCalculo
-# Importa tus módulos de algoritmos de reemplazo de páginas
-from Algoritmos.algoritmos import Algoritmos
+# Registro de algoritmos de reemplazo de páginas (los motores se importan al usarlos)
+from Algoritmos import registro
+from Algoritmos.cache_resultados import CacheResultados
+from ControllerWindows.modelos_tabla import ModeloReferencias
+from ControllerWindows.trabajador_calculo import TrabajadorCalculo
+
+# Caché de resultados compartida por todas las ventanas de cálculo; se crea
+# al primer cálculo (ver _cache_compartida), no al importar el módulo
+_cache = None
+
+
+def _cache_compartida():
+    """La caché en disco, o None si no se puede crear su directorio (se calcula sin caché)."""
+    global _cache
+    if _cache is None:
+        try:
+            _cache = CacheResultados()
+        except OSError:
+            return None
+    return _cache
+
 
 class ControllerVentanaCalculo(QMainWindow):
     def __init__(self, referencia_list):
@@ -12,39 +31,40 @@ class ControllerVentanaCalculo(QMainWindow):
         self.ui = Ui_VentanaCalculo()
         self.ui.setupUi(self)
         # Lista de referencia que viene de la ventana principal
-        self.referencias = referencia_list  # e.g. [2,3,2,3,5,...]
+        self.referencias = referencia_list  # Traza (o lista) de páginas, e.g. [2,3,2,3,5,...]
         self.marcos = None
         self.algoritmo = None
         self.result_window = None  # Para mantener referencia
+        self.trabajador = None     # Cálculo en curso (QThreadPool)
+        # El combo de algoritmos se llena desde el registro
+        self.ui.seleccionar_algoritmo.clear()
+        self.ui.seleccionar_algoritmo.addItems(registro.nombres())
         self._fill_referencias()
         self._connect_signals()
 
     def _fill_referencias(self):
-        # Rellena la QTableWidget con 1 fila y tantas columnas como elementos
-        refs = self.referencias
-        tw = self.ui.tabla_referencias
-        tw.setRowCount(1)
-        tw.setColumnCount(len(refs))
-        tw.verticalHeader().setVisible(False)
-        tw.horizontalHeader().setVisible(False)
+        # La tira de 1 fila lee las referencias desde la lista vía un modelo:
+        # no se crea un item por referencia, así abre al instante con trazas grandes
+        tv = self.ui.tabla_referencias
+        self.modelo_referencias = ModeloReferencias(self.referencias, self)
+        tv.setModel(self.modelo_referencias)
+        tv.verticalHeader().setVisible(False)
+        tv.horizontalHeader().setVisible(False)
         # Ajusta estilo: texto blanco en todas las celdas
-        tw.setStyleSheet("""
-            QTableWidget {
+        tv.setStyleSheet("""
+            QTableView {
                 background-color: #343434;
                 color: white;            /* Texto en blanco */
                 gridline-color: #555555;
             }
         """)
-        for col, val in enumerate(refs):
-            itm = QTableWidgetItem(str(val))
-            itm.setTextAlignment(QtCore.Qt.AlignCenter)
-            tw.setItem(0, col, itm)
 
     def _connect_signals(self):
         self.ui.boton_volver.clicked.connect(self._volver)
         self.ui.boton_confirmar_marcos.clicked.connect(self._confirmar_marcos)
         self.ui.boton_confirmar_algoritmo.clicked.connect(self._confirmar_algoritmo)
         self.ui.boton_calcular_algoritmo.clicked.connect(self._calcular_algoritmo)
+        self.ui.boton_cancelar_calculo.clicked.connect(self._cancelar_calculo)
 
     def _volver(self):
         from ControllerWindows.controller_ventana_principal import ControllerVentanaPrincipal
@@ -75,8 +95,6 @@ class ControllerVentanaCalculo(QMainWindow):
         self.ui.boton_calcular_algoritmo.setEnabled(True)
 
     def _calcular_algoritmo(self):
-        from ControllerWindows.controller_ventana_resultados import ControllerVentanaResultados
-
         if self.marcos is None:
             QMessageBox.warning(self, "Error", "Debe confirmar primero el número de marcos.")
             return
@@ -84,29 +102,75 @@ class ControllerVentanaCalculo(QMainWindow):
             QMessageBox.warning(self, "Error", "Debe confirmar primero el algoritmo a usar.")
             return
 
-        # Ejecuta el algoritmo elegido
-        algoritmos=Algoritmos()
-        try:
-            if self.algoritmo == "FIFO":
-                matrix, faults_per_column, total_faults = algoritmos.fifo(self.referencias, self.marcos)
-            elif self.algoritmo == "LRU":
-                matrix, faults_per_column, total_faults = algoritmos.lru(self.referencias, self.marcos)
-            elif self.algoritmo == "OPTIMO":
-                matrix, faults_per_column, total_faults = algoritmos.optimo(self.referencias, self.marcos)
-            elif self.algoritmo == "FIFO MEJORADO":
-                matrix, faults_per_column, total_faults = algoritmos.fifo_mejorado(self.referencias, self.marcos)
-            else:
-                raise ValueError("Algoritmo no reconocido")
-        except Exception as e:
-            QMessageBox.critical(self, "Error al ejecutar algoritmo", str(e))
-            return
+        # Ejecuta el algoritmo elegido (resultado compacto por eventos); si la
+        # misma combinación ya se calculó antes, se toma de la caché en disco
+        referencias, marcos, algoritmo = self.referencias, self.marcos, self.algoritmo
+
+        def calcular(progreso):
+            def simular():
+                politica = registro.obtener(algoritmo)
+                return politica.simular(referencias, marcos, eventos=True, progreso=progreso)
+            cache = _cache_compartida()
+            if cache is None:
+                return simular()
+            return cache.resultado(referencias, marcos, algoritmo, simular, tipo="eventos")
+
+        # El cálculo corre en un hilo aparte; la ventana sigue respondiendo
+        self.trabajador = TrabajadorCalculo(calcular)
+        self.trabajador.senales.progreso.connect(self._mostrar_progreso)
+        self.trabajador.senales.terminado.connect(self._calculo_terminado)
+        self.trabajador.senales.error.connect(self._calculo_fallido)
+        self.trabajador.senales.cancelado.connect(self._calculo_cancelado)
+
+        self.ui.boton_calcular_algoritmo.setEnabled(False)
+        self.ui.boton_volver.setEnabled(False)
+        self.ui.barra_progreso.setRange(0, max(len(referencias), 1))
+        self.ui.barra_progreso.setValue(0)
+        self.ui.barra_progreso.setVisible(True)
+        self.ui.boton_cancelar_calculo.setEnabled(True)
+        self.ui.boton_cancelar_calculo.setVisible(True)
+        QThreadPool.globalInstance().start(self.trabajador)
+
+    def _cancelar_calculo(self):
+        if self.trabajador is not None:
+            self.trabajador.cancelar()
+            self.ui.boton_cancelar_calculo.setEnabled(False)
+
+    def _mostrar_progreso(self, referencias, fallos):
+        self.ui.barra_progreso.setValue(referencias)
+        self.statusBar().showMessage(
+            f"Procesadas {referencias} de {len(self.referencias)} referencias, {fallos} fallos"
+        )
+
+    def _fin_calculo(self):
+        # Deja la ventana lista para otro cálculo
+        self.trabajador = None
+        self.ui.barra_progreso.setVisible(False)
+        self.ui.boton_cancelar_calculo.setVisible(False)
+        self.ui.boton_calcular_algoritmo.setEnabled(True)
+        self.ui.boton_volver.setEnabled(True)
+
+    def _calculo_fallido(self, mensaje):
+        self._fin_calculo()
+        QMessageBox.critical(self, "Error al ejecutar algoritmo", mensaje)
+
+    def _calculo_cancelado(self):
+        self._fin_calculo()
+        self.statusBar().showMessage("Cálculo cancelado")
+
+    def _calculo_terminado(self, resultado):
+        from ControllerWindows.controller_ventana_resultados import ControllerVentanaResultados
+
+        self._fin_calculo()
+        if _cache is not None:
+            self.statusBar().showMessage(
+                f"Caché: {_cache.aciertos_cache} aciertos, {_cache.fallos_cache} fallos"
+            )
 
         # Abre la ventana de resultados y le pasa los datos
         self.result_window = ControllerVentanaResultados(
             referencia=self.referencias,
-            matrix=matrix,
-            faults=faults_per_column,
-            total_faults=total_faults,
+            resultado=resultado,
             algoritmo=self.algoritmo,
             parent_window=self
         )
@@ -1,8 +1,13 @@
 # Controller/controller_ventana_principal.py
 
 
-from PyQt5.QtWidgets import QMainWindow, QMessageBox
+from PyQt5.QtCore import QThreadPool
+from PyQt5.QtWidgets import QFileDialog, QInputDialog, QMainWindow, QMessageBox
 from DesignWindows.ventana_principal import Ui_MainWindow
+from Algoritmos.referencias import leer_referencias, ReferenciasInvalidas
+from Algoritmos.lector_trazas import cargar_traza, compresion_de, formato_de
+from Algoritmos.traza import Traza
+from ControllerWindows.trabajador_calculo import TrabajadorCalculo
 from ControllerWindows.controller_ventana_calculo import ControllerVentanaCalculo  # Asegúrate de tener este controlador implementado
 
 class ControllerVentanaPrincipal(QMainWindow):
@@ -10,6 +15,8 @@ class ControllerVentanaPrincipal(QMainWindow):
         super().__init__()
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
+        # QLineEdit corta en 32767 caracteres por defecto; se permiten trazas pegadas grandes
+        self.ui.campo_ingresar_cadena.setMaxLength(2**31 - 1)
         self.conectarEventos()
 
     def conectarEventos(self):
@@ -17,6 +24,8 @@ class ControllerVentanaPrincipal(QMainWindow):
         self.ui.boton_salir.clicked.connect(self.salir)
         # Conecta el botón siguiente para abrir la ventana de tabla y enviarle el número de procesos
         self.ui.boton_siguiente.clicked.connect(self.siguiente)
+        # Conecta el botón para leer la cadena de referencia desde un archivo
+        self.ui.boton_cargar_traza.clicked.connect(self.cargar_archivo)
 
     def salir(self):
         self.close()
@@ -24,20 +33,93 @@ class ControllerVentanaPrincipal(QMainWindow):
 
     def siguiente(self):
         text = self.ui.campo_ingresar_cadena.text().strip()
-        # 1) Validación: la cadena no debe estar vacía y debe contener solo dígitos
+        # 1) Validación: la cadena no debe estar vacía
         if not text:
             QMessageBox.warning(self, "Cadena vacía",
-                                "Por favor ingresa una cadena de dígitos.")
+                                "Por favor ingresa una cadena de páginas.")
             return
-        if not text.isdigit():
-            QMessageBox.warning(self, "Formato inválido",
-                                "Solo se permiten dígitos (0–9), sin espacios ni otros caracteres.")
+
+        # 2) Conversión a arreglo de enteros: una cadena solo de dígitos se lee
+        #    como antes (un dígito por página); con comas, espacios o saltos de
+        #    línea cada número es una página, de cualquier cantidad de dígitos
+        try:
+            paginas = leer_referencias(text)
+        except ReferenciasInvalidas as e:
+            QMessageBox.warning(self, "Formato inválido", str(e))
+            return
+        if len(paginas) == 0:
+            QMessageBox.warning(self, "Cadena vacía",
+                                "Por favor ingresa una cadena de páginas.")
+            return
+        self.abrir_calculo(Traza.desde(paginas))
+
+    def cargar_archivo(self):
+        ruta, _ = QFileDialog.getOpenFileName(
+            self, "Cargar traza", "",
+            "Trazas (*.txt *.u32 *.bin *.u64 *.trz *.lackey *.gz *.xz *.bz2);;Todos los archivos (*)"
+        )
+        if not ruta:
             return
+        ventana = self._pedir_ventana(ruta)
+        if ventana is None:
+            return
+        inicio, cantidad = ventana
+        # La lectura (posiblemente de varios GB) corre fuera del hilo de la GUI
+        self.ui.boton_siguiente.setEnabled(False)
+        self.ui.boton_cargar_traza.setEnabled(False)
+        self.statusBar().showMessage(f"Cargando {ruta}...")
+        self.trabajador = TrabajadorCalculo(
+            lambda progreso: cargar_traza(ruta, inicio=inicio, cantidad=cantidad))
+        self.trabajador.senales.terminado.connect(self._traza_cargada)
+        self.trabajador.senales.error.connect(self._error_carga)
+        QThreadPool.globalInstance().start(self.trabajador)
+
+    def _pedir_ventana(self, ruta):
+        """
+        (inicio, cantidad) de la traza a cargar, o None si se canceló. Un .trz
+        sin comprimir tiene índice de bloques: se ofrece abrir solo una parte
+        desde cualquier posición, sin decodificar lo anterior. Los demás
+        formatos se cargan completos.
+        """
+        if formato_de(ruta) != "compacta" or compresion_de(ruta) is not None:
+            return 0, None
+        from Algoritmos.traza_compacta import TrazaCompacta
+
+        try:
+            total = len(TrazaCompacta(ruta))
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Error al cargar la traza", str(e))
+            return None
+        if total == 0:
+            return 0, None
+        # QInputDialog.getInt trabaja con int de 32 bits
+        maximo = min(total, 2**31 - 1)
+        inicio, ok = QInputDialog.getInt(
+            self, "Ventana de la traza",
+            f"La traza tiene {total} referencias.\nPrimera referencia a cargar (desde 0):",
+            0, 0, maximo - 1)
+        if not ok:
+            return None
+        cantidad, ok = QInputDialog.getInt(
+            self, "Ventana de la traza", "Cantidad de referencias a cargar:",
+            min(total - inicio, maximo), 1, min(total - inicio, maximo))
+        if not ok:
+            return None
+        return inicio, cantidad
 
-        # 2) Conversión a lista de enteros
-        referencias = [int(caracter) for caracter in text]
-        print(referencias)
+    def _error_carga(self, mensaje):
+        self.ui.boton_siguiente.setEnabled(True)
+        self.ui.boton_cargar_traza.setEnabled(True)
+        self.statusBar().clearMessage()
+        QMessageBox.warning(self, "Error al cargar la traza", mensaje)
+
+    def _traza_cargada(self, traza):
+        if len(traza) == 0:
+            self._error_carga("El archivo no contiene páginas.")
+            return
+        self.abrir_calculo(traza)
 
+    def abrir_calculo(self, referencias):
         #Crear y mostrar la ventana de cálculo, pasándole la lista
         self.ventana_calculo = ControllerVentanaCalculo(referencias)
         self.ventana_calculo.show()
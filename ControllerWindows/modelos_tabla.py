@@ -0,0 +1,107 @@
+# ControllerWindows/modelos_tabla.py
+
+from collections import OrderedDict
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QBrush, QColor
+
+
+class ModeloReferencias(QAbstractTableModel):
+    """
+    Tira de una fila con la lista de referencia, leída directamente de la
+    secuencia (lista, arreglo o Traza) sin copiarla ni crear items por celda.
+    """
+
+    def __init__(self, referencia, parent=None):
+        super().__init__(parent)
+        self.referencia = referencia
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.referencia)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return str(self.referencia[index.column()])
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+
+class ModeloResultados(QAbstractTableModel):
+    """
+    Modelo de la tabla de resultados sobre un ResultadoEventos, sin crear un
+    QTableWidgetItem por celda: la vista pide solo las celdas visibles y cada
+    columna de marcos se reconstruye a pedido desde los eventos.
+
+      - fila 0: lista de referencia (fondo azul oscuro)
+      - filas 1..marcos: estado de cada marco ("pagina*" si el bit está en 1)
+      - última fila: '*' en rojo si hubo fallo
+
+    Las últimas columnas reconstruidas se guardan en una caché pequeña, ya que
+    la vista pide cada celda de una columna por separado.
+    """
+
+    MAX_COLUMNAS_CACHE = 512
+
+    def __init__(self, referencia, resultado, parent=None):
+        super().__init__(parent)
+        self.referencia = referencia
+        self.resultado = resultado
+        self._columnas = OrderedDict()
+        # Pinceles creados una sola vez y compartidos por todas las celdas
+        self._fondo_referencia = QBrush(QColor("#003366"))   # azul oscuro
+        self._texto_referencia = QBrush(QColor("white"))
+        self._texto_fallo = QBrush(QColor("red"))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 1 + self.resultado.marcos + 1
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.resultado.n
+
+    def _columna(self, c):
+        # Textos de los marcos en la columna c
+        if c in self._columnas:
+            self._columnas.move_to_end(c)
+            return self._columnas[c]
+        paginas = self.resultado.columna(c)
+        if self.resultado.con_bits:
+            bits = self.resultado.columna_bits(c)
+            textos = ['' if p == '' else f"{p}{'*' if b else ''}" for p, b in zip(paginas, bits)]
+        else:
+            textos = [str(p) for p in paginas]
+        self._columnas[c] = textos
+        if len(self._columnas) > self.MAX_COLUMNAS_CACHE:
+            self._columnas.popitem(last=False)
+        return textos
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        fila, c = index.row(), index.column()
+        ultima = self.resultado.marcos + 1
+
+        if role == Qt.DisplayRole:
+            if fila == 0:
+                return str(self.referencia[c])
+            if fila == ultima:
+                return '*' if self.resultado.es_fallo(c) else ''
+            return self._columna(c)[fila - 1]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.BackgroundRole and fila == 0:
+            return self._fondo_referencia
+        if role == Qt.ForegroundRole:
+            if fila == 0:
+                return self._texto_referencia
+            if fila == ultima and self.resultado.es_fallo(c):
+                return self._texto_fallo
+        return None
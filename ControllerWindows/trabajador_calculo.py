@@ -0,0 +1,50 @@
+# ControllerWindows/trabajador_calculo.py
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class CalculoCancelado(Exception):
+    pass
+
+
+class SenalesCalculo(QObject):
+    # QRunnable no es QObject: las señales viven en este objeto aparte
+    progreso = pyqtSignal(int, int)   # referencias procesadas, fallos hasta ahora
+    terminado = pyqtSignal(object)    # resultado del algoritmo
+    error = pyqtSignal(str)
+    cancelado = pyqtSignal()
+
+
+class TrabajadorCalculo(QRunnable):
+    """
+    Ejecuta calcular(progreso) en un hilo de QThreadPool para no bloquear la
+    GUI. calcular recibe un callback progreso(referencias, fallos) que el
+    algoritmo llama cada tanto; ahí se emite la señal de progreso y, si se
+    pidió cancelar, se lanza CalculoCancelado para cortar la simulación.
+
+    Las señales se entregan en el hilo de la ventana (conexión en cola).
+    """
+
+    def __init__(self, calcular):
+        super().__init__()
+        self.calcular = calcular
+        self.senales = SenalesCalculo()
+        self._cancelar = False
+
+    def cancelar(self):
+        self._cancelar = True
+
+    def _progreso(self, referencias, fallos):
+        if self._cancelar:
+            raise CalculoCancelado()
+        self.senales.progreso.emit(referencias, fallos)
+
+    def run(self):
+        try:
+            resultado = self.calcular(self._progreso)
+        except CalculoCancelado:
+            self.senales.cancelado.emit()
+        except Exception as e:
+            self.senales.error.emit(str(e))
+        else:
+            self.senales.terminado.emit(resultado)
@@ -46,6 +46,16 @@ class Ui_MainWindow(object):
         self.boton_calcular_algoritmo.setStyleSheet("background-color: rgb(20, 20, 255);\n"
 "font: 700 12pt \"Arial Rounded MT\";")
         self.boton_calcular_algoritmo.setObjectName("boton_calcular_algoritmo")
+        self.boton_cancelar_calculo = QtWidgets.QPushButton(self.centralwidget)
+        self.boton_cancelar_calculo.setVisible(False)
+        self.boton_cancelar_calculo.setGeometry(QtCore.QRect(530, 510, 91, 31))
+        self.boton_cancelar_calculo.setStyleSheet("background-color: rgb(127, 127, 127);")
+        self.boton_cancelar_calculo.setObjectName("boton_cancelar_calculo")
+        self.barra_progreso = QtWidgets.QProgressBar(self.centralwidget)
+        self.barra_progreso.setVisible(False)
+        self.barra_progreso.setGeometry(QtCore.QRect(300, 560, 221, 16))
+        self.barra_progreso.setProperty("value", 0)
+        self.barra_progreso.setObjectName("barra_progreso")
         self.imagen_pulgar = QtWidgets.QLabel(self.centralwidget)
         self.imagen_pulgar.setGeometry(QtCore.QRect(640, 360, 161, 151))
         self.imagen_pulgar.setStyleSheet("image: url(:/icono/icono+pulgar.png);")
@@ -87,22 +97,16 @@ class Ui_MainWindow(object):
         self.seleccionar_algoritmo.setStyleSheet("background-color: rgb(165, 165, 165);\n"
 "")
         self.seleccionar_algoritmo.setObjectName("seleccionar_algoritmo")
-        self.seleccionar_algoritmo.addItem("")
-        self.seleccionar_algoritmo.addItem("")
-        self.seleccionar_algoritmo.addItem("")
-        self.seleccionar_algoritmo.addItem("")
         self.boton_confirmar_algoritmo = QtWidgets.QPushButton(self.centralwidget)
         self.boton_confirmar_algoritmo.setEnabled(True)
         self.boton_confirmar_algoritmo.setGeometry(QtCore.QRect(330, 420, 151, 31))
         self.boton_confirmar_algoritmo.setStyleSheet("background-color: rgb(20, 20, 255);\n"
 "font: 700 8pt \"Arial Rounded MT\";")
         self.boton_confirmar_algoritmo.setObjectName("boton_confirmar_algoritmo")
-        self.tabla_referencias = QtWidgets.QTableWidget(self.centralwidget)
+        self.tabla_referencias = QtWidgets.QTableView(self.centralwidget)
         self.tabla_referencias.setGeometry(QtCore.QRect(20, 120, 761, 71))
         self.tabla_referencias.setStyleSheet("background-color: rgb(52, 52, 52);")
         self.tabla_referencias.setObjectName("tabla_referencias")
-        self.tabla_referencias.setColumnCount(0)
-        self.tabla_referencias.setRowCount(0)
         self.tabla_referencias.horizontalHeader().setDefaultSectionSize(39)
         MainWindow.setCentralWidget(self.centralwidget)
         self.menubar = QtWidgets.QMenuBar(MainWindow)
@@ -124,6 +128,7 @@ class Ui_MainWindow(object):
         self.titulo_ventana.setText(_translate("MainWindow", "<html><head/><body><p align=\"center\">IMPLEMENTAR ALGORITMOS</p></body></html>"))
         self.boton_volver.setText(_translate("MainWindow", "VOLVER"))
         self.boton_calcular_algoritmo.setText(_translate("MainWindow", "MOSTRAR ALGORITMO"))
+        self.boton_cancelar_calculo.setText(_translate("MainWindow", "CANCELAR"))
         self.subtitulo_lista_paginas.setToolTip(_translate("MainWindow", "<html><head/><body><p align=\"center\"><br/></p></body></html>"))
         self.subtitulo_lista_paginas.setWhatsThis(_translate("MainWindow", "<html><head/><body><p align=\"center\"><br/></p></body></html>"))
         self.subtitulo_lista_paginas.setText(_translate("MainWindow", "LISTA DE REFERENCIA DE PAGINAS"))
@@ -131,9 +136,5 @@ class Ui_MainWindow(object):
         self.ingresar_marcos.setText(_translate("MainWindow", "3"))
         self.label_escoger_algoritmo.setText(_translate("MainWindow", "Elija el algoritmo que desea mostrar"))
         self.boton_confirmar_marcos.setText(_translate("MainWindow", "CONFIRMAR NUMERO DE MARCOS"))
-        self.seleccionar_algoritmo.setItemText(0, _translate("MainWindow", "FIFO"))
-        self.seleccionar_algoritmo.setItemText(1, _translate("MainWindow", "LRU"))
-        self.seleccionar_algoritmo.setItemText(2, _translate("MainWindow", "OPTIMO"))
-        self.seleccionar_algoritmo.setItemText(3, _translate("MainWindow", "FIFO MEJORADO"))
         self.boton_confirmar_algoritmo.setText(_translate("MainWindow", "CONFIRMAR ALGORITMO"))
 from DesignWindows.imagenes import imagenes_new
@@ -45,6 +45,11 @@ class Ui_MainWindow(object):
         self.boton_siguiente.setStyleSheet("background-color: rgb(20, 20, 255);\n"
 "font: 700 12pt \"Arial Rounded MT\";")
         self.boton_siguiente.setObjectName("boton_siguiente")
+        self.boton_cargar_traza = QtWidgets.QPushButton(self.centralwidget)
+        self.boton_cargar_traza.setGeometry(QtCore.QRect(310, 470, 181, 31))
+        self.boton_cargar_traza.setStyleSheet("background-color: rgb(127, 127, 127);\n"
+"font: 700 8pt \"Arial Rounded MT\";")
+        self.boton_cargar_traza.setObjectName("boton_cargar_traza")
         self.icono_windows = QtWidgets.QLabel(self.centralwidget)
         self.icono_windows.setGeometry(QtCore.QRect(350, 110, 101, 131))
         self.icono_windows.setStyleSheet("image: url(:/icono/icono+windows3.png);")
@@ -96,6 +101,7 @@ class Ui_MainWindow(object):
         self.titulo_ventana.raise_()
         self.boton_salir.raise_()
         self.boton_siguiente.raise_()
+        self.boton_cargar_traza.raise_()
         self.subtitulo_procesos_a_simular.raise_()
         self.icono_windows.raise_()
         self.icono_apple.raise_()
@@ -125,6 +131,7 @@ class Ui_MainWindow(object):
         self.titulo_ventana.setText(_translate("MainWindow", "<html><head/><body><p align=\"center\"><span style=\" font-size:14pt; font-style:italic;\">ALGORITMOS DE REMPLAZO</span></p><p align=\"center\"><span style=\" font-size:14pt; font-style:italic;\">DE PAGINAS</span></p></body></html>"))
         self.boton_salir.setText(_translate("MainWindow", "SALIR"))
         self.boton_siguiente.setText(_translate("MainWindow", "SIGUIENTE"))
+        self.boton_cargar_traza.setText(_translate("MainWindow", "CARGAR TRAZA DESDE ARCHIVO"))
         self.label_FIFO.setWhatsThis(_translate("MainWindow", "<html><head/><body><p align=\"center\"><br/></p></body></html>"))
         self.label_FIFO.setText(_translate("MainWindow", "<html><head/><body><p align=\"center\"><span style=\" font-style:italic;\">FIFO</span></p></body></html>"))
         self.label_LRU.setWhatsThis(_translate("MainWindow", "<html><head/><body><p align=\"center\"><br/></p></body></html>"))
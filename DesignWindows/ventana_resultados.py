@@ -53,12 +53,10 @@ class Ui_MainWindow(object):
 "background-color: rgb(0, 0, 0);\n"
 "font: 75 12pt \"System\";")
         self.label_numero_fallos.setObjectName("label_numero_fallos")
-        self.matriz_resultados = QtWidgets.QTableWidget(self.centralwidget)
+        self.matriz_resultados = QtWidgets.QTableView(self.centralwidget)
         self.matriz_resultados.setGeometry(QtCore.QRect(20, 110, 771, 381))
         self.matriz_resultados.setStyleSheet("background-color: rgb(33, 33, 33);")
         self.matriz_resultados.setObjectName("matriz_resultados")
-        self.matriz_resultados.setColumnCount(0)
-        self.matriz_resultados.setRowCount(0)
         MainWindow.setCentralWidget(self.centralwidget)
         self.menubar = QtWidgets.QMenuBar(MainWindow)
         self.menubar.setGeometry(QtCore.QRect(0, 0, 806, 21))